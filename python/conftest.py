@@ -0,0 +1,13 @@
+"""
+Shared pytest setup for the python/ tests
+"""
+import os
+import sys
+
+# Make run, db_manager and view_results importable however pytest is invoked
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# DB_DRIVER=psycopg2 hides psycopg 3 so the suite covers db_manager's
+# psycopg2 fallback (CI runs both)
+if os.getenv("DB_DRIVER") == "psycopg2":
+    sys.modules["psycopg"] = None
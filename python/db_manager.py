@@ -2,14 +2,294 @@
 Manager for working with PostgreSQL database
 """
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import io
+import csv
+import select
 import json
-from typing import Optional, Dict, List
+import contextlib
+import functools
+import threading
+import weakref
+from typing import Callable, Optional, Dict, List
 
+# Prefer psycopg 3 (server-side prepared statements, binary protocol,
+# pipeline mode); fall back to psycopg2 while deployments migrate
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+    from psycopg.types.json import Jsonb, set_json_loads
+    from psycopg_pool import ConnectionPool
 
+    HAS_PSYCOPG3 = True
+    OperationalError = psycopg.OperationalError
+    InterfaceError = psycopg.InterfaceError
+except ImportError:
+    import psycopg2
+    from psycopg2.extras import Json, RealDictCursor, register_default_jsonb
+    from psycopg2.pool import ThreadedConnectionPool
+
+    # execute_values appeared in psycopg2 2.7
+    try:
+        from psycopg2.extras import execute_values
+    except ImportError:
+        execute_values = None
+
+    HAS_PSYCOPG3 = False
+    OperationalError = psycopg2.OperationalError
+    InterfaceError = psycopg2.InterfaceError
+
+
+@functools.lru_cache(maxsize=1)
+def _asyncpg():
+    """
+    asyncpg module, or None when it is not installed.
+
+    asyncpg backs AsyncDatabaseManager only and is optional; importing it
+    on first use keeps ~30ms off every run.py / view_results.py start.
+    """
+    try:
+        import asyncpg
+    except ImportError:
+        return None
+    return asyncpg
+
+
+# orjson is several times faster than the stdlib codec; optional
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Connections kept open / allowed at most by the pool
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 10
+
+# Seconds to wait for the pool to fill at startup
+POOL_TIMEOUT = 10
+
+# Pool bounds for AsyncDatabaseManager
+ASYNC_POOL_MIN_SIZE = 2
+ASYNC_POOL_MAX_SIZE = 20
+
+# Rows fetched per round-trip by asyncpg server-side cursors
+CURSOR_PREFETCH = 200
+
+# libpq TCP settings so a dead server or network is noticed within
+# seconds instead of blocking on the socket (identical keys for both drivers)
+KEEPALIVE_PARAMS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+    "tcp_user_timeout": 10000,  # ms
+}
+
+# Per-session server settings sent in the libpq startup packet. Benchmark
+# rows are cheap to regenerate, so commits return without waiting for the
+# WAL flush; a server crash can lose only the last few hundred ms of rows
+SESSION_OPTIONS = "-c synchronous_commit=off"
+
+# Notified once per INSERT/COPY statement on benchmark_results (sql/init.sql)
+RESULTS_CHANNEL = "benchmark_results_inserted"
+
+# sql/init.sql only runs when the postgres volume is first created
+# (docker-entrypoint-initdb.d), so databases created before a schema change
+# are upgraded on connect by re-running the idempotent script. The check
+# is one catalog query; the script runs only when it reports a gap
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "sql", "init.sql")
+SCHEMA_CURRENT_SQL = (
+    "SELECT (SELECT COUNT(*) FROM information_schema.columns "
+    "WHERE table_name = 'benchmark_results' "
+    "AND column_name IN ('vector_size', 'lookup_iterations')) = 2 "
+    "AND EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'benchmark_stats_truncate')"
+)
+
+# Serializes schema upgrades from processes connecting at the same time
+SCHEMA_LOCK_ID = 0x62656E63
+
+# Executions after which psycopg 3 prepares a statement server-side
+PREPARE_THRESHOLD = 1
+
+# Hot parameters stored in dedicated integer columns instead of repeating
+# their keys in every row's jsonb; the rest of the dict stays in parameters
+PROMOTED_PARAMS = ("vector_size", "lookup_iterations")
+
+# Insert column order; _row_values() builds tuples in the same order
+INSERT_COLUMNS = (
+    "task_number, task_name, method_name, parameters, execution_time_ns, "
+    "operations_per_second, thread_count, build_type, notes, vector_size, lookup_iterations"
+)
+
+# Single-row insert on psycopg 3; %b sends every parameter in binary
+# format, so parameters reach the server as jsonb instead of text
+INSERT_ROW_SQL = (
+    f"INSERT INTO benchmark_results ({INSERT_COLUMNS}) "
+    "VALUES (%b, %b, %b, %b, %b, %b, %b, %b, %b, %b, %b)"
+)
+
+# Server-side prepared insert for psycopg2, which has no automatic
+# statement preparation (psycopg 3 relies on PREPARE_THRESHOLD instead)
+PREPARE_INSERT_SQL = (
+    "PREPARE benchmark_insert "
+    "(int, text, text, jsonb, bigint, double precision, int, text, text, int, int) AS "
+    f"INSERT INTO benchmark_results ({INSERT_COLUMNS}) "
+    "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)"
+)
+EXECUTE_INSERT_SQL = "EXECUTE benchmark_insert (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+# Multi-row insert template for execute_values (VALUES %s is expanded per page)
+INSERT_SQL = f"INSERT INTO benchmark_results ({INSERT_COLUMNS}) VALUES %s"
+
+# Result columns with the promoted parameters folded back into parameters,
+# so callers see the same dict they saved
+RESULT_PARAMETERS = (
+    "NULLIF(COALESCE(parameters, '{}'::jsonb) || jsonb_strip_nulls(jsonb_build_object("
+    "'vector_size', vector_size, 'lookup_iterations', lookup_iterations)), '{}'::jsonb)"
+)
+RESULT_COLUMNS = (
+    "id, timestamp, task_number, task_name, method_name, "
+    f"{RESULT_PARAMETERS} AS parameters, "
+    "execution_time_ns, operations_per_second, thread_count, build_type, notes"
+)
+
+# Per-row VALUES tuple for building multi-row INSERTs with mogrify()
+# when execute_values is not available
+ROW_TEMPLATE_SQL = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+# Rows per generated INSERT statement in bulk saves
+BULK_PAGE_SIZE = 1000
+
+COPY_SQL = f"COPY benchmark_results ({INSERT_COLUMNS}) FROM STDIN WITH (FORMAT CSV)"
+
+# Below this row count COPY setup costs more than it saves
+COPY_MIN_ROWS = 500
+
+# Queries are built once at import: psycopg 3 keys its prepared statement
+# cache by query text, so every call must pass the identical string
+GET_RESULTS_SQL = (
+    f"SELECT {RESULT_COLUMNS} FROM benchmark_results "
+    "ORDER BY timestamp DESC LIMIT %s"
+)
+GET_RESULTS_BY_TASK_SQL = (
+    f"SELECT {RESULT_COLUMNS} FROM benchmark_results "
+    "WHERE task_number = %s ORDER BY timestamp DESC LIMIT %s"
+)
+GET_RESULTS_BY_BUILD_SQL = (
+    f"SELECT {RESULT_COLUMNS} FROM benchmark_results "
+    "WHERE build_type = %s ORDER BY timestamp DESC LIMIT %s"
+)
+GET_RESULTS_BY_TASK_BUILD_SQL = (
+    f"SELECT {RESULT_COLUMNS} FROM benchmark_results "
+    "WHERE task_number = %s AND build_type = %s ORDER BY timestamp DESC LIMIT %s"
+)
+
+# CSV export formatted by the server: ISO 8601 timestamps, the defaults
+# view_results used to fill in, and parameters as JSON text. One statement
+# per (task filter, build filter) combination; COPY binds client-side
+EXPORT_CSV_COLUMNS = (
+    "to_char(timestamp, 'YYYY-MM-DD\"T\"HH24:MI:SS.US') AS timestamp, "
+    "COALESCE(build_type, 'Release') AS build_type, task_number, task_name, method_name, "
+    "execution_time_ns, operations_per_second, COALESCE(thread_count, 1) AS thread_count, "
+    f"COALESCE({RESULT_PARAMETERS}::text, 'null') AS parameters"
+)
+EXPORT_CSV_SQL = {
+    filters: (
+        f"COPY (SELECT {EXPORT_CSV_COLUMNS} FROM benchmark_results {where}"
+        "ORDER BY benchmark_results.timestamp DESC LIMIT %s) TO STDOUT WITH (FORMAT CSV, HEADER)"
+    )
+    for filters, where in {
+        (False, False): "",
+        (True, False): "WHERE task_number = %s ",
+        (False, True): "WHERE build_type = %s ",
+        (True, True): "WHERE task_number = %s AND build_type = %s ",
+    }.items()
+}
+
+SUMMARY_COLUMNS = (
+    "to_char(timestamp, 'YYYY-MM-DD HH24:MI:SS') AS ts, "
+    "task_name, method_name, execution_time_ns, thread_count"
+)
+GET_RESULTS_SUMMARY_SQL = (
+    f"SELECT {SUMMARY_COLUMNS} FROM benchmark_results "
+    "ORDER BY timestamp DESC LIMIT %s"
+)
+GET_RESULTS_SUMMARY_BY_TASK_SQL = (
+    f"SELECT {SUMMARY_COLUMNS} FROM benchmark_results "
+    "WHERE task_number = %s ORDER BY timestamp DESC LIMIT %s"
+)
+
+# Statistics and comparisons read the running totals in benchmark_stats
+# (kept up to date by triggers, see sql/init.sql), one row per
+# task/method/build type, instead of aggregating benchmark_results.
+# Results saved without a build type are kept there under ''
+STATISTICS_COLUMNS = (
+    "method_name, NULLIF(build_type, '') AS build_type, run_count AS count, "
+    "total_time_ns / run_count AS avg_time_ns, "
+    "min_time_ns, max_time_ns, "
+    "total_ops / NULLIF(ops_count, 0) AS avg_ops_per_sec"
+)
+TASK_STATISTICS_SQL = (
+    f"SELECT {STATISTICS_COLUMNS} FROM benchmark_stats "
+    "WHERE task_number = %s "
+    "ORDER BY build_type, avg_time_ns"
+)
+TASK_STATISTICS_BY_BUILD_SQL = (
+    f"SELECT {STATISTICS_COLUMNS} FROM benchmark_stats "
+    "WHERE task_number = %s AND build_type = %s "
+    "ORDER BY avg_time_ns"
+)
+
+# Average time of one build type from its (single) benchmark_stats row
+RELEASE_AVG = (
+    "SUM(total_time_ns) FILTER (WHERE build_type = 'Release') "
+    "/ SUM(run_count) FILTER (WHERE build_type = 'Release')"
+)
+DEBUG_AVG = (
+    "SUM(total_time_ns) FILTER (WHERE build_type = 'Debug') "
+    "/ SUM(run_count) FILTER (WHERE build_type = 'Debug')"
+)
+COMPARISON_COLUMNS = (
+    "method_name, "
+    f"{RELEASE_AVG} AS release_avg, "
+    f"{DEBUG_AVG} AS debug_avg, "
+    f"{DEBUG_AVG} / NULLIF({RELEASE_AVG}, 0) AS slowdown, "
+    "SUM(total_ops) FILTER (WHERE build_type = 'Release') "
+    "/ NULLIF(SUM(ops_count) FILTER (WHERE build_type = 'Release'), 0) AS release_ops"
+)
+COMPARE_BUILD_TYPES_SQL = (
+    f"SELECT {COMPARISON_COLUMNS} FROM benchmark_stats "
+    "WHERE task_number = %s GROUP BY method_name ORDER BY method_name"
+)
+COMPARE_BUILD_TYPES_BY_METHOD_SQL = (
+    f"SELECT {COMPARISON_COLUMNS} FROM benchmark_stats "
+    "WHERE task_number = %s AND method_name = %s GROUP BY method_name ORDER BY method_name"
+)
+
+# asyncpg uses numbered placeholders
+ASYNC_GET_RESULTS_SQL = (
+    f"SELECT {RESULT_COLUMNS} FROM benchmark_results "
+    "ORDER BY timestamp DESC LIMIT $1"
+)
+ASYNC_GET_RESULTS_BY_TASK_SQL = (
+    f"SELECT {RESULT_COLUMNS} FROM benchmark_results "
+    "WHERE task_number = $1 ORDER BY timestamp DESC LIMIT $2"
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_build_type() -> str:
-    """Get build type from .build_info file or environment"""
+    """
+    Get build type from .build_info file or environment.
+
+    The result is cached for the process lifetime; call
+    get_build_type.cache_clear() to re-read it.
+    """
     # First check environment variable
     build_type = os.getenv("BUILD_TYPE", "")
     if build_type:
@@ -27,30 +307,272 @@ def get_build_type() -> str:
     return "Release"
 
 
+def get_connection_params() -> Dict:
+    """Get libpq connection parameters from environment"""
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "port": os.getenv("DB_PORT", "5432"),
+        "dbname": os.getenv("DB_NAME", "benchmark_kit_db"),
+        "user": os.getenv("DB_USER", "benchmark_kit"),
+        "password": os.getenv("DB_PASSWORD", "benchmark_kit_pass"),
+    }
+
+
 class DatabaseManager:
-    def __init__(self):
-        self.conn = None
+    def __init__(self, min_size: int = POOL_MIN_SIZE):
+        """
+        Open a pool keeping min_size connections ready.
+
+        One-shot command line tools that query from a single thread can
+        pass min_size=1 to avoid opening connections they never use.
+        """
+        self.pool = None
+        self._min_size = min_size
+        self._build_type = get_build_type()
+        # Connection pinned to the current thread by pipeline()
+        self._local = threading.local()
+        # psycopg2 connections that already have benchmark_insert prepared
+        self._prepared = weakref.WeakSet()
         self._connect()
 
     def _connect(self):
-        """Connect to database"""
+        """Open connection pool"""
+        params = self._session_params()
         try:
-            self.conn = psycopg2.connect(
-                host=os.getenv("DB_HOST", "localhost"),
-                port=os.getenv("DB_PORT", "5432"),
-                database=os.getenv("DB_NAME", "benchmark_kit_db"),
-                user=os.getenv("DB_USER", "benchmark_kit"),
-                password=os.getenv("DB_PASSWORD", "benchmark_kit_pass"),
-            )
-            self.conn.autocommit = True
-        except psycopg2.OperationalError as e:
+            if HAS_PSYCOPG3:
+                # The pool retries failed connections in the background,
+                # so probe once to fail fast when the server is down
+                with psycopg.connect(autocommit=True, **params) as conn:
+                    self._upgrade_schema(conn)
+                self.pool = ConnectionPool(
+                    kwargs={
+                        "autocommit": True,
+                        "prepare_threshold": PREPARE_THRESHOLD,
+                        **params,
+                    },
+                    min_size=self._min_size,
+                    max_size=POOL_MAX_SIZE,
+                    timeout=POOL_TIMEOUT,
+                    # Decode jsonb parameters with orjson when available
+                    configure=lambda conn: set_json_loads(_json_loads, conn),
+                    open=False,
+                )
+                self.pool.open(wait=True, timeout=POOL_TIMEOUT)
+            else:
+                # Upgrade before the pool: _prepare() needs the current columns
+                conn = psycopg2.connect(**params)
+                try:
+                    conn.autocommit = True
+                    self._upgrade_schema(conn)
+                finally:
+                    conn.close()
+                self.pool = ThreadedConnectionPool(self._min_size, POOL_MAX_SIZE, **params)
+        except OperationalError as e:
             print(f"Database connection error: {e}")
             print("Make sure PostgreSQL is running and accessible")
-            self.conn = None
+            self.pool = None
+
+    def _upgrade_schema(self, conn):
+        """Apply sql/init.sql when the database predates the current schema"""
+        try:
+            with conn.cursor() as cur:
+                cur.execute(SCHEMA_CURRENT_SQL)
+                if cur.fetchone()[0]:
+                    return
+                with open(SCHEMA_FILE) as f:
+                    script = f.read()
+                with self._transaction(conn):
+                    cur.execute("SELECT pg_advisory_xact_lock(%s)", (SCHEMA_LOCK_ID,))
+                    cur.execute(script)
+            print("Database schema upgraded")
+        except Exception as e:
+            # Still connect: reads of the existing columns keep working
+            print(f"Database schema upgrade failed: {e}")
 
     def is_connected(self) -> bool:
         """Check connection"""
-        return self.conn is not None
+        return self.pool is not None
+
+    @staticmethod
+    def _session_params() -> Dict:
+        """libpq parameters shared by pooled and dedicated connections"""
+        return {**get_connection_params(), **KEEPALIVE_PARAMS, "options": SESSION_OPTIONS}
+
+    def _prepare(self, conn):
+        """Prepare benchmark_insert and the jsonb decoder once per psycopg2 connection"""
+        if conn in self._prepared:
+            return
+        conn.autocommit = True
+        register_default_jsonb(conn, loads=_json_loads)
+        with conn.cursor() as cur:
+            cur.execute(PREPARE_INSERT_SQL)
+        self._prepared.add(conn)
+
+    @contextlib.contextmanager
+    def _connection(self):
+        """
+        Check out a pooled connection for the duration of one call.
+
+        Inside pipeline() the connection pinned to the current thread is
+        reused so the whole burst goes over a single session.
+        """
+        pinned = getattr(self._local, "conn", None)
+        if pinned is not None:
+            yield pinned
+            return
+
+        if HAS_PSYCOPG3:
+            with self.pool.connection() as conn:
+                yield conn
+        else:
+            conn = self.pool.getconn()
+            try:
+                self._prepare(conn)
+                yield conn
+            finally:
+                # Broken connections are dropped instead of pooled
+                self.pool.putconn(conn, close=bool(conn.closed))
+
+    def _retry_once(self, operation: Callable, idempotent: bool = True):
+        """
+        Run operation(conn) on a pooled connection.
+
+        A connection that died while idle in the pool (server restart,
+        network drop) only fails on first use, and its idle siblings
+        usually died with it. On such a failure the pool is cleared of
+        dead connections and the operation is retried once. Writes pass
+        idempotent=False: the server may have committed before the
+        connection dropped, so they are not replayed and the error goes
+        to the caller. Statements inside pipeline() are not retried
+        either: the burst cannot be replayed.
+        """
+        try:
+            with self._connection() as conn:
+                return operation(conn)
+        except (OperationalError, InterfaceError):
+            if getattr(self._local, "conn", None) is not None:
+                raise
+            self._reconnect()
+            if not idempotent or not self.is_connected():
+                raise
+            with self._connection() as conn:
+                return operation(conn)
+
+    def _reconnect(self):
+        """Replace dead pooled connections after a connection failure"""
+        if HAS_PSYCOPG3:
+            # Probes idle connections and refills the pool in the background
+            self.pool.check()
+        else:
+            # psycopg2 pools cannot probe idle connections; start over
+            old_pool = self.pool
+            self._connect()
+            old_pool.closeall()
+
+    @contextlib.contextmanager
+    def pipeline(self):
+        """
+        Context manager batching the statements issued inside it.
+
+        On psycopg 3 this enters libpq pipeline mode: queries are sent
+        back-to-back and results are read at the end of the block, so a
+        burst of N inserts costs about one round-trip instead of N. On
+        psycopg2 (or without pipeline support in libpq) it is a no-op.
+        """
+        if not (HAS_PSYCOPG3 and self.is_connected() and psycopg.Pipeline.is_supported()):
+            yield
+            return
+
+        outer = getattr(self._local, "conn", None)
+        with self._connection() as conn, conn.pipeline():
+            self._local.conn = conn
+            try:
+                yield
+            finally:
+                self._local.conn = outer
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transaction(conn):
+        """
+        Group the statements issued inside the block into one commit.
+
+        Pooled connections run in autocommit mode, where every statement
+        is its own transaction and WAL flush.
+        """
+        if HAS_PSYCOPG3:
+            with conn.transaction():
+                yield
+            return
+
+        conn.autocommit = False
+        try:
+            yield
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            if not conn.closed:
+                conn.autocommit = True
+
+    @staticmethod
+    def _dict_cursor(conn):
+        """Open a cursor returning rows as dicts"""
+        if HAS_PSYCOPG3:
+            return conn.cursor(row_factory=dict_row)
+        return conn.cursor(cursor_factory=RealDictCursor)
+
+    @staticmethod
+    def _json_param(parameters: Optional[Dict]):
+        """Wrap parameters in the driver's jsonb adapter"""
+        if not parameters:
+            return None
+        if HAS_PSYCOPG3:
+            return Jsonb(parameters, dumps=_json_dumps)
+        return Json(parameters, dumps=_json_dumps)
+
+    def _row_values(
+        self,
+        task_number: int,
+        task_name: str,
+        method_name: str,
+        execution_time_ns: int,
+        parameters: Optional[Dict] = None,
+        thread_count: int = 1,
+        operations_per_second: Optional[float] = None,
+        notes: Optional[str] = None,
+        build_type: Optional[str] = None,
+        as_text: bool = False,
+    ) -> tuple:
+        """
+        Build INSERT parameters in benchmark_results column order.
+
+        PROMOTED_PARAMS are moved out of parameters into their own
+        columns. The remainder is passed through the jsonb adapter;
+        as_text=True serializes it to a JSON string instead (for COPY).
+        """
+        # Default to the build type detected at construction
+        if build_type is None:
+            build_type = self._build_type
+
+        parameters = dict(parameters) if parameters else {}
+        promoted = tuple(parameters.pop(key, None) for key in PROMOTED_PARAMS)
+
+        return (
+            task_number,
+            task_name,
+            method_name,
+            (_json_dumps(parameters) if parameters else None)
+            if as_text
+            else self._json_param(parameters),
+            execution_time_ns,
+            operations_per_second,
+            thread_count,
+            build_type,
+            notes,
+        ) + promoted
 
     def save_benchmark_result(
         self,
@@ -68,61 +590,195 @@ class DatabaseManager:
         if not self.is_connected():
             return False
 
-        # Auto-detect build type if not provided
-        if build_type is None:
-            build_type = get_build_type()
+        values = self._row_values(
+            task_number,
+            task_name,
+            method_name,
+            execution_time_ns,
+            parameters,
+            thread_count,
+            operations_per_second,
+            notes,
+            build_type,
+        )
+
+        def run(conn):
+            with conn.cursor() as cur:
+                cur.execute(INSERT_ROW_SQL if HAS_PSYCOPG3 else EXECUTE_INSERT_SQL, values)
 
         try:
-            with self.conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO benchmark_results 
-                    (task_number, task_name, method_name, parameters, 
-                     execution_time_ns, operations_per_second, thread_count, build_type, notes)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                    (
-                        task_number,
-                        task_name,
-                        method_name,
-                        json.dumps(parameters) if parameters else None,
-                        execution_time_ns,
-                        operations_per_second,
-                        thread_count,
-                        build_type,
-                        notes,
-                    ),
-                )
+            self._retry_once(run, idempotent=False)
             return True
         except Exception as e:
             print(f"Error saving result: {e}")
             return False
 
+    def save_benchmark_results_bulk(self, rows: List[Dict]) -> bool:
+        """
+        Save several benchmark results in one round-trip.
+
+        Each row is a dict with the same keys as save_benchmark_result()
+        arguments. On psycopg2 rows are folded into multi-row INSERT
+        statements of up to BULK_PAGE_SIZE rows each; psycopg 3 sends a
+        prepared single-row INSERT per row using its pipelined executemany().
+        Either way the batch is committed once.
+        """
+        if not self.is_connected():
+            return False
+        if not rows:
+            return True
+
+        def run(conn):
+            with self._transaction(conn), conn.cursor() as cur:
+                if HAS_PSYCOPG3:
+                    cur.executemany(INSERT_ROW_SQL, values)
+                elif execute_values is not None:
+                    execute_values(cur, INSERT_SQL, values, template=None, page_size=BULK_PAGE_SIZE)
+                else:
+                    self._insert_mogrified(cur, values)
+
+        try:
+            values = [self._row_values(**row) for row in rows]
+            self._retry_once(run, idempotent=False)
+            return True
+        except Exception as e:
+            print(f"Error saving results: {e}")
+            return False
+
+    @staticmethod
+    def _insert_mogrified(cur, values: List[tuple]):
+        """
+        Multi-row INSERT for psycopg2 builds without execute_values.
+
+        Rows are rendered client-side with mogrify() and sent as one
+        statement per BULK_PAGE_SIZE rows.
+        """
+        insert_prefix = INSERT_SQL.replace("%s", "").encode()
+        for start in range(0, len(values), BULK_PAGE_SIZE):
+            page = values[start:start + BULK_PAGE_SIZE]
+            cur.execute(
+                insert_prefix + b",".join(cur.mogrify(ROW_TEMPLATE_SQL, row) for row in page)
+            )
+
+    def copy_benchmark_results(self, rows: List[Dict]) -> bool:
+        """
+        Save a large batch of benchmark results using COPY FROM STDIN.
+
+        Rows use the same dict format as save_benchmark_results_bulk().
+        Batches smaller than COPY_MIN_ROWS are delegated to the bulk
+        INSERT path. None values are written as unquoted empty CSV
+        fields, which COPY reads as NULL.
+        """
+        if not self.is_connected():
+            return False
+        if len(rows) < COPY_MIN_ROWS:
+            return self.save_benchmark_results_bulk(rows)
+
+        def run(conn):
+            with conn.cursor() as cur:
+                if HAS_PSYCOPG3:
+                    with cur.copy(COPY_SQL) as copy:
+                        copy.write(buf.getvalue())
+                else:
+                    buf.seek(0)
+                    cur.copy_expert(COPY_SQL, buf)
+
+        try:
+            buf = io.StringIO()
+            writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
+            writer.writerows(self._row_values(**row, as_text=True) for row in rows)
+            self._retry_once(run, idempotent=False)
+            return True
+        except Exception as e:
+            print(f"Error copying results: {e}")
+            return False
+
+    def export_results_csv(
+        self,
+        file,
+        task_number: Optional[int] = None,
+        limit: int = 10000,
+        build_type: Optional[str] = None
+    ) -> int:
+        """
+        Write the latest results as CSV with a header row to the binary file.
+
+        Rows are selected like get_results() and formatted by the server
+        through COPY TO STDOUT. Returns the number of rows written.
+        """
+        if not self.is_connected():
+            return 0
+
+        sql = EXPORT_CSV_SQL[(bool(task_number), bool(build_type))]
+        params = tuple(p for p in (task_number, build_type) if p) + (limit,)
+        start = file.tell()
+
+        def run(conn):
+            # A retried attempt replaces the partial output of the failed one
+            file.seek(start)
+            file.truncate()
+            with conn.cursor() as cur:
+                if HAS_PSYCOPG3:
+                    with cur.copy(sql, params) as copy:
+                        for data in copy:
+                            file.write(data)
+                else:
+                    cur.copy_expert(cur.mogrify(sql, params).decode(), file)
+                return cur.rowcount
+
+        try:
+            return self._retry_once(run)
+        except Exception as e:
+            print(f"Error exporting results: {e}")
+            return 0
+
     def get_results(
         self,
         task_number: Optional[int] = None,
-        limit: int = 100
+        limit: int = 100,
+        build_type: Optional[str] = None
     ) -> List[Dict]:
-        """Get results from database"""
+        """Get the latest results, optionally filtered by task and build type"""
         if not self.is_connected():
             return []
 
+        def run(conn):
+            with self._dict_cursor(conn) as cur:
+                if task_number and build_type:
+                    cur.execute(GET_RESULTS_BY_TASK_BUILD_SQL, (task_number, build_type, limit))
+                elif task_number:
+                    cur.execute(GET_RESULTS_BY_TASK_SQL, (task_number, limit))
+                elif build_type:
+                    cur.execute(GET_RESULTS_BY_BUILD_SQL, (build_type, limit))
+                else:
+                    cur.execute(GET_RESULTS_SQL, (limit,))
+                return cur.fetchall()
+
         try:
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            return self._retry_once(run)
+        except Exception as e:
+            print(f"Error getting results: {e}")
+            return []
+
+    def get_results_summary(
+        self,
+        task_number: Optional[int] = None,
+        limit: int = 50
+    ) -> List[Dict]:
+        """Get the columns shown in result listings, timestamp formatted as ts"""
+        if not self.is_connected():
+            return []
+
+        def run(conn):
+            with self._dict_cursor(conn) as cur:
                 if task_number:
-                    cur.execute("""
-                        SELECT * FROM benchmark_results
-                        WHERE task_number = %s
-                        ORDER BY timestamp DESC
-                        LIMIT %s
-                    """, (task_number, limit))
+                    cur.execute(GET_RESULTS_SUMMARY_BY_TASK_SQL, (task_number, limit))
                 else:
-                    cur.execute("""
-                        SELECT * FROM benchmark_results
-                        ORDER BY timestamp DESC
-                        LIMIT %s
-                    """, (limit,))
+                    cur.execute(GET_RESULTS_SUMMARY_SQL, (limit,))
                 return cur.fetchall()
+
+        try:
+            return self._retry_once(run)
         except Exception as e:
             print(f"Error getting results: {e}")
             return []
@@ -134,45 +790,16 @@ class DatabaseManager:
         if not self.is_connected():
             return {}
 
-        try:
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+        def run(conn):
+            with self._dict_cursor(conn) as cur:
                 if build_type:
-                    cur.execute(
-                        """
-                        SELECT 
-                            method_name,
-                            build_type,
-                            COUNT(*) as count,
-                            AVG(execution_time_ns) as avg_time_ns,
-                            MIN(execution_time_ns) as min_time_ns,
-                            MAX(execution_time_ns) as max_time_ns,
-                            AVG(operations_per_second) as avg_ops_per_sec
-                        FROM benchmark_results
-                        WHERE task_number = %s AND build_type = %s
-                        GROUP BY method_name, build_type
-                        ORDER BY avg_time_ns
-                    """,
-                        (task_number, build_type),
-                    )
+                    cur.execute(TASK_STATISTICS_BY_BUILD_SQL, (task_number, build_type))
                 else:
-                    cur.execute(
-                        """
-                        SELECT 
-                            method_name,
-                            build_type,
-                            COUNT(*) as count,
-                            AVG(execution_time_ns) as avg_time_ns,
-                            MIN(execution_time_ns) as min_time_ns,
-                            MAX(execution_time_ns) as max_time_ns,
-                            AVG(operations_per_second) as avg_ops_per_sec
-                        FROM benchmark_results
-                        WHERE task_number = %s
-                        GROUP BY method_name, build_type
-                        ORDER BY build_type, avg_time_ns
-                    """,
-                        (task_number,),
-                    )
+                    cur.execute(TASK_STATISTICS_SQL, (task_number,))
                 return cur.fetchall()
+
+        try:
+            return self._retry_once(run)
         except Exception as e:
             print(f"Error getting statistics: {e}")
             return {}
@@ -180,53 +807,175 @@ class DatabaseManager:
     def compare_build_types(
         self, task_number: int, method_name: Optional[str] = None
     ) -> List[Dict]:
-        """Compare Release vs Debug performance for a task"""
+        """
+        Compare Release vs Debug performance for a task.
+
+        Returns one row per method with release_avg, debug_avg (ns),
+        slowdown (debug_avg / release_avg) and release_ops; values are
+        None when a build type has no runs.
+        """
         if not self.is_connected():
             return []
 
-        try:
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+        def run(conn):
+            with self._dict_cursor(conn) as cur:
                 if method_name:
-                    cur.execute(
-                        """
-                        SELECT 
-                            method_name,
-                            build_type,
-                            COUNT(*) as runs,
-                            AVG(execution_time_ns) as avg_time_ns,
-                            MIN(execution_time_ns) as best_time_ns,
-                            AVG(operations_per_second) as avg_ops_per_sec
-                        FROM benchmark_results
-                        WHERE task_number = %s AND method_name = %s
-                        GROUP BY method_name, build_type
-                        ORDER BY method_name, build_type
-                    """,
-                        (task_number, method_name),
-                    )
+                    cur.execute(COMPARE_BUILD_TYPES_BY_METHOD_SQL, (task_number, method_name))
                 else:
-                    cur.execute(
-                        """
-                        SELECT 
-                            method_name,
-                            build_type,
-                            COUNT(*) as runs,
-                            AVG(execution_time_ns) as avg_time_ns,
-                            MIN(execution_time_ns) as best_time_ns,
-                            AVG(operations_per_second) as avg_ops_per_sec
-                        FROM benchmark_results
-                        WHERE task_number = %s
-                        GROUP BY method_name, build_type
-                        ORDER BY method_name, build_type
-                    """,
-                        (task_number,),
-                    )
+                    cur.execute(COMPARE_BUILD_TYPES_SQL, (task_number,))
                 return cur.fetchall()
+
+        try:
+            return self._retry_once(run)
         except Exception as e:
             print(f"Error comparing build types: {e}")
             return []
 
+    @contextlib.contextmanager
+    def listen(self, channel: str = RESULTS_CHANNEL):
+        """
+        Dedicated connection LISTENing on channel.
+
+        Yields wait(timeout), which blocks until a notification arrives
+        (True) or timeout seconds pass (False). Notifications queued in
+        the meantime are consumed together, so a burst of inserts wakes
+        the caller once. The connection is kept out of the pool because
+        LISTEN is per session.
+        """
+        if HAS_PSYCOPG3:
+            conn = psycopg.connect(autocommit=True, **self._session_params())
+
+            def wait(timeout: float) -> bool:
+                if not any(True for _ in conn.notifies(timeout=timeout, stop_after=1)):
+                    return False
+                for _ in conn.notifies(timeout=0):
+                    pass
+                return True
+        else:
+            conn = psycopg2.connect(**self._session_params())
+            conn.autocommit = True
+
+            def wait(timeout: float) -> bool:
+                readable = conn.notifies or select.select([conn], [], [], timeout)[0]
+                while readable:
+                    conn.poll()
+                    readable = select.select([conn], [], [], 0)[0]
+                notified = bool(conn.notifies)
+                conn.notifies.clear()
+                return notified
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {channel}")
+            yield wait
+        finally:
+            conn.close()
+
     def close(self):
-        """Close connection"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Close connection pool"""
+        if self.pool:
+            if HAS_PSYCOPG3:
+                self.pool.close()
+            else:
+                # Prepared statements are dropped with their sessions
+                self.pool.closeall()
+            self.pool = None
+
+
+class AsyncDatabaseManager:
+    """
+    asyncio counterpart of DatabaseManager for concurrent readers.
+
+    Intended for the HTTP server integration, where many requests query
+    the database at once; the interactive console keeps using the
+    synchronous DatabaseManager. Requires asyncpg.
+
+    Usage:
+        db = await AsyncDatabaseManager.create()
+        results = await db.get_results(task_number=2)
+        await db.close()
+    """
+
+    def __init__(self):
+        self.pool = None
+
+    @classmethod
+    async def create(cls) -> "AsyncDatabaseManager":
+        """Create manager and open its connection pool"""
+        db = cls()
+        await db._connect()
+        return db
+
+    @staticmethod
+    async def _init_connection(conn):
+        """Decode jsonb to Python objects like psycopg does"""
+        await conn.set_type_codec(
+            "jsonb", encoder=_json_dumps, decoder=_json_loads, schema="pg_catalog"
+        )
+
+    async def _connect(self):
+        """Open connection pool"""
+        asyncpg = _asyncpg()
+        if asyncpg is None:
+            print("asyncpg is not installed: pip3 install asyncpg")
+            return
+
+        params = get_connection_params()
+        try:
+            self.pool = await asyncpg.create_pool(
+                host=params["host"],
+                port=int(params["port"]),
+                database=params["dbname"],
+                user=params["user"],
+                password=params["password"],
+                min_size=ASYNC_POOL_MIN_SIZE,
+                max_size=ASYNC_POOL_MAX_SIZE,
+                init=self._init_connection,
+            )
+        except (OSError, asyncpg.PostgresError) as e:
+            print(f"Database connection error: {e}")
+            print("Make sure PostgreSQL is running and accessible")
+            self.pool = None
+
+    def is_connected(self) -> bool:
+        """Check connection"""
+        return self.pool is not None
+
+    async def get_results(
+        self,
+        task_number: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        Get results from database.
+
+        Rows are streamed through a server-side cursor CURSOR_PREFETCH
+        at a time instead of being buffered by the server in one reply.
+        """
+        if not self.is_connected():
+            return []
+
+        if task_number:
+            query = ASYNC_GET_RESULTS_BY_TASK_SQL
+            args = (task_number, limit)
+        else:
+            query = ASYNC_GET_RESULTS_SQL
+            args = (limit,)
+
+        try:
+            async with self.pool.acquire() as conn:
+                # asyncpg cursors only exist inside a transaction
+                async with conn.transaction():
+                    return [
+                        dict(row)
+                        async for row in conn.cursor(query, *args, prefetch=CURSOR_PREFETCH)
+                    ]
+        except Exception as e:
+            print(f"Error getting results: {e}")
+            return []
+
+    async def close(self):
+        """Close connection pool"""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
@@ -6,9 +6,10 @@ import sys
 import os
 import time
 import signal
-import select
+import shutil
 import subprocess
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List
 
 # Global flag for graceful shutdown
 _shutdown_requested = False
@@ -27,72 +28,504 @@ signal.signal(signal.SIGTERM, signal_handler)
 signal.signal(signal.SIGINT, signal_handler)
 
 
-def interruptible_input(prompt: str) -> str:
-    """Read input with ability to be interrupted by signals"""
-    global _shutdown_requested
-    sys.stdout.write(prompt)
-    sys.stdout.flush()
+# Paths derived from this script's location, resolved once
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+_BUILD_DIR = os.path.join(_PROJECT_ROOT, 'build')
+_SERVER_PATH = os.path.join(_BUILD_DIR, 'asio_server')
 
-    while not _shutdown_requested:
-        # Check if stdin has data (timeout 0.5 sec)
-        ready, _, _ = select.select([sys.stdin], [], [], 0.5)
-        if ready:
-            line = sys.stdin.readline()
-            if not line:  # EOF
-                raise KeyboardInterrupt()
-            return line.rstrip("\n")
+# Visual pacing pauses only make sense on a terminal
+_INTERACTIVE = sys.stdout.isatty()
 
-    raise KeyboardInterrupt()
+# Add path to modules
+sys.path.insert(0, _SCRIPT_DIR)
 
+# DatabaseManager pulls in the DB driver and the C++ bindings load a shared
+# library; both are imported on first use so menus and --help start fast
+_DatabaseManager = None
+_cpp = None
+_cpp_import_attempted = False
+
+
+def _get_database_manager():
+    """Import DatabaseManager on first use"""
+    global _DatabaseManager
+    if _DatabaseManager is None:
+        try:
+            from db_manager import DatabaseManager
+        except ImportError:
+            print("Error: failed to import db_manager")
+            print("Make sure dependencies are installed: pip3 install -r requirements.txt")
+            sys.exit(1)
+        _DatabaseManager = DatabaseManager
+    return _DatabaseManager
 
-# Add path to modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-try:
-    from db_manager import DatabaseManager
-except ImportError:
-    print("Error: failed to import db_manager")
-    print("Make sure dependencies are installed: pip3 install -r requirements.txt")
-    sys.exit(1)
-
-# Global flags for C++ module availability
-CPP_MODULE_AVAILABLE = False
-cpp = None
-
-# Try to import C++ bindings module
-try:
-    # Get script directory and add build/ to sys.path
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    build_dir = os.path.join(os.path.dirname(script_dir), 'build')
-    
-    if build_dir not in sys.path:
-        sys.path.insert(0, build_dir)
 
-    # Try new module name first, fall back to legacy name
+def _get_cpp():
+    """Import C++ bindings module on first use; None when not built"""
+    global _cpp, _cpp_import_attempted
+    if _cpp_import_attempted:
+        return _cpp
+    _cpp_import_attempted = True
+
     try:
-        import benchmark_kit_bindings as cpp  # type: ignore[import-not-found]
-    except ImportError:
-        # Legacy module name kept for backward compatibility
-        import cpp_interview_bindings as cpp  # type: ignore[import-not-found]  # noqa: F401
-
-    CPP_MODULE_AVAILABLE = True
-except ImportError as e:
-    # Graceful degradation: continue in stub mode
-    print("\n" + "=" * 70)
-    print("WARNING: C++ module 'benchmark_kit_bindings' not found")
-    print("=" * 70)
-    print("The application will continue in stub mode.")
-    print("\nTo build the C++ module, run:")
-    print("  mkdir -p build && cd build && cmake .. && make")
-    print("\nError details:", str(e))
-    print("=" * 70 + "\n")
-    CPP_MODULE_AVAILABLE = False
+        # Add build/ to sys.path
+        if _BUILD_DIR not in sys.path:
+            sys.path.insert(0, _BUILD_DIR)
+
+        # Try new module name first, fall back to legacy name
+        try:
+            import benchmark_kit_bindings as cpp  # type: ignore[import-not-found]
+        except ImportError:
+            # Legacy module name kept for backward compatibility
+            import cpp_interview_bindings as cpp  # type: ignore[import-not-found]  # noqa: F401
+
+        _cpp = cpp
+    except ImportError as e:
+        # Graceful degradation: continue in stub mode
+        sys.stdout.write(CPP_IMPORT_FAILED_TEXT.format(error=e))
+    return _cpp
+
+
+def __getattr__(name):
+    """Resolve cpp and CPP_MODULE_AVAILABLE lazily for `from run import ...`"""
+    if name == "cpp":
+        return _get_cpp()
+    if name == "CPP_MODULE_AVAILABLE":
+        return _get_cpp() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Task 2 erase methods as (display name, DB method key, binding name),
+# built once at import
+TASK2_METHODS = (
+    ("Naive erase", "naive_erase", "benchmark_naive_erase"),
+    ("remove_if + erase", "remove_if_erase", "benchmark_remove_if_erase"),
+    ("Iterators", "iterators_erase", "benchmark_iterators_erase"),
+    ("Copy to new vector", "copy_erase", "benchmark_copy_erase"),
+    ("Partition", "partition_erase", "benchmark_partition_erase"),
+)
+
+
+def task2_benchmarks() -> tuple:
+    """
+    (display name, method key, benchmark function) for each task 2 method.
+
+    Only the function lookup happens per benchmark run; functions are not
+    cached for the process, so reloaded or patched bindings are picked up.
+    """
+    cpp = _get_cpp()
+    return tuple((name, key, getattr(cpp, attr)) for name, key, attr in TASK2_METHODS)
+
+
+# Task 3 containers in the same (display name, DB method key, binding name)
+# shape; both names match the container_name each BenchmarkResult carries
+TASK3_METHODS = (
+    ("std::map (arena)", "std::map (arena)", "benchmark_map"),
+    ("std::unordered_map (arena)", "std::unordered_map (arena)", "benchmark_unordered_map"),
+    ("vector SoA+SIMD", "vector SoA+SIMD", "benchmark_vector"),
+    ("flat_hash_map", "flat_hash_map", "benchmark_flat_hash"),
+)
+
+
+def task3_benchmarks() -> tuple:
+    """(display name, method key, benchmark function) for each task 3 container"""
+    cpp = _get_cpp()
+    return tuple((name, key, getattr(cpp, attr)) for name, key, attr in TASK3_METHODS)
+
+
+def run_benchmarks_concurrently(methods, *args) -> list:
+    """
+    Call every (name, key, function) benchmark with args on its own thread.
+
+    The bindings release the GIL inside benchmark_*, so independent
+    methods overlap instead of running back to back. Returns the results
+    (execution times, or BenchmarkResult objects for task 3) in method order.
+    The methods then contend for cores, caches and memory bandwidth, so
+    this is opt-in (--concurrent) and the saved rows are flagged.
+    """
+    with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+        futures = [executor.submit(benchmark_func, *args) for _, _, benchmark_func in methods]
+        return [future.result() for future in futures]
+
+
+PERF_ROW = "    ⏱ {:<22} IPC {:>5.2f}  cache MPKI {:>7.2f}  branch MPKI {:>6.2f}"
+
+
+def format_perf_counters(name: str, values) -> str:
+    """IPC and cache/branch misses per thousand instructions for one call"""
+    ipc = values.instructions / values.cycles if values.cycles else 0.0
+    per_kilo = 1000 / values.instructions if values.instructions else 0.0
+    return PERF_ROW.format(
+        name, ipc, values.cache_misses * per_kilo, values.branch_misses * per_kilo
+    )
+
+
+def profiled(name: str, benchmark_func):
+    """
+    Wrap benchmark_func so each call prints the hardware counters it incurred.
+
+    Counters follow the calling thread, so wrapped methods can still be
+    handed to run_benchmarks_concurrently.
+    """
+    def call(*args):
+        counters = _get_cpp().PerfCounters()
+        counters.start()
+        result = benchmark_func(*args)
+        print(format_perf_counters(name, counters.stop()))
+        return result
+    return call
+
+
+def run_benchmarks_serially(methods, *args) -> list:
+    """
+    Call every (name, key, function) benchmark with args, one at a time.
+
+    Slower than run_benchmarks_concurrently, but no method shares cores,
+    caches or memory bandwidth with another, so timings stay comparable.
+    """
+    return [benchmark_func(*args) for _, _, benchmark_func in methods]
+
+
+def ops_per_second(operations: int, times_ns: List[int]) -> List[float]:
+    """Operations per second for each execution time in nanoseconds"""
+    scaled = operations * 1e9
+    return [scaled / t for t in times_ns]
+
+
+def task1_row(execution_time_ns: int, iterations: int, threads: int,
+              operations_per_second: float) -> dict:
+    """DB row for a task 1 weak_ptr::lock() benchmark"""
+    return {
+        "task_number": 1,
+        "task_name": "weak_ptr::lock()",
+        "method_name": "CustomWeakPtr::lock()",
+        "execution_time_ns": execution_time_ns,
+        "parameters": {"iterations": iterations},
+        "thread_count": threads,
+        "operations_per_second": operations_per_second
+    }
+
+
+def task2_rows(
+    timings, vector_size: int, iterations: int, threads: int, concurrent: bool = False
+) -> List[dict]:
+    """DB rows for task 2 given (method key, execution time ns, ops/sec) triples"""
+    # Identical for every method; the DB layer copies it before use
+    parameters = {"vector_size": vector_size, "iterations": iterations}
+    if concurrent:
+        # Methods shared the CPU, so these timings are not comparable to serial runs
+        parameters["concurrent"] = True
+    return [
+        {
+            "task_number": 2,
+            "task_name": "Vector erase",
+            "method_name": method_key,
+            "execution_time_ns": execution_time_ns,
+            "parameters": parameters,
+            "thread_count": threads,
+            "operations_per_second": operations_per_second
+        }
+        for method_key, execution_time_ns, operations_per_second in timings
+    ]
+
+
+def task3_rows(
+    results, element_count: int, lookup_iterations: int, concurrent: bool = False
+) -> List[dict]:
+    """DB rows for task 3 BenchmarkResult objects, lookup time as primary metric"""
+    lookup_ops = ops_per_second(
+        lookup_iterations, [result.lookup_time_ns for result in results]
+    )
+    # Shared run parameters are copied per row; only the timings differ
+    base_params = {"element_count": element_count, "lookup_iterations": lookup_iterations}
+    if concurrent:
+        base_params["concurrent"] = True
+    rows = []
+    for result, operations_per_second in zip(results, lookup_ops):
+        parameters = base_params.copy()
+        parameters["insert_time_ns"] = result.insert_time_ns
+        parameters["erase_time_ns"] = result.erase_time_ns
+        parameters["memory_usage_bytes"] = result.memory_usage_bytes
+        rows.append({
+            "task_number": 3,
+            "task_name": "Mapping benchmark",
+            "method_name": result.container_name,
+            "execution_time_ns": result.lookup_time_ns,
+            "parameters": parameters,
+            "thread_count": 1,
+            "operations_per_second": operations_per_second
+        })
+    return rows
+
+
+# Read size when streaming source files and server output to the terminal
+COPY_CHUNK_SIZE = 64 * 1024
+
+# Prepended to each line of asio_server output
+SERVER_OUTPUT_PREFIX = b"[server] "
+
+
+def pump_prefixed_output(fd: int, write, prefix: bytes = SERVER_OUTPUT_PREFIX) -> None:
+    """
+    Copy raw bytes from fd to write() until EOF, prefixing every line.
+
+    Reads whatever is available in chunks; a partial trailing line is
+    carried over until its newline arrives.
+    """
+    carry = b""
+    while True:
+        chunk = os.read(fd, COPY_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = carry + chunk
+        end = data.rfind(b"\n") + 1
+        if end:
+            write(prefix + data[:end - 1].replace(b"\n", b"\n" + prefix) + b"\n")
+        carry = data[end:]
+    if carry:
+        write(prefix + carry + b"\n")
+
+
+# Menus and static text are joined once at import and written with a
+# single sys.stdout.write() per display
+CPP_MISSING_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "WARNING: C++ module is not available",
+    "=" * 70,
+    "To build the C++ module, run:",
+    "  mkdir -p build && cd build && cmake .. && make",
+    "=" * 70,
+    "",
+    "",
+])
+
+# Filled in with the ImportError when the bindings fail to load
+CPP_IMPORT_FAILED_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "WARNING: C++ module 'benchmark_kit_bindings' not found",
+    "=" * 70,
+    "The application will continue in stub mode.",
+    "",
+    "To build the C++ module, run:",
+    "  mkdir -p build && cd build && cmake .. && make",
+    "",
+    "Error details: {error}",
+    "=" * 70,
+    "",
+    "",
+])
+
+MAIN_MENU_TEXT = "\n".join([
+    "",
+    "=" * 50,
+    "C++ Benchmark Kit - Main Menu",
+    "=" * 50,
+    "[1] Example 1: weak_ptr::lock() implementation",
+    "[2] Example 2: Remove every second element from vector",
+    "[3] Example 3: Mapping integer to string",
+    "[4] Run all benchmarks",
+    "[5] View results from DB",
+    "[6] Start REST API server",
+    "[0] Exit",
+    "=" * 50,
+    "",
+])
+
+TASK1_MENU_TEXT = "\n".join([
+    "",
+    "=== Task 1: weak_ptr::lock() ===",
+    "Demonstration of reference counter implementation",
+    "",
+    "[1] Show implementation source code",
+    "[2] Run demonstration",
+    "[3] Run benchmark",
+    "[0] Back to main menu",
+    "",
+])
+
+TASK2_MENU_TEXT = "\n".join([
+    "",
+    "=== Task 2: Remove every second element ===",
+    "[1] Erase in loop method (naive)",
+    "[2] remove_if + erase method",
+    "[3] Iterators method",
+    "[4] Copy to new vector method",
+    "[5] Run comparative benchmark of all methods",
+    "[0] Back to main menu",
+    "",
+])
+
+TASK3_MENU_TEXT = "\n".join([
+    "",
+    "=== Task 3: Mapping number to string ===",
+    "[1] Show container analysis",
+    "[2] Run comparative benchmark",
+    "[0] Back to main menu",
+    "",
+])
+
+TASK3_ANALYSIS_TEXT = "\n".join([
+    "",
+    "=== Container analysis for int -> string mapping ===",
+    "",
+    "1. std::map<int, std::string> (arena-allocated nodes)",
+    "   - Lookup complexity: O(log n)",
+    "   - Ordered: yes",
+    "   - Use case: when ordering is needed",
+    "",
+    "2. std::unordered_map<int, std::string> (arena-allocated nodes)",
+    "   - Lookup complexity: O(1) average, O(n) worst",
+    "   - Ordered: no",
+    "   - Use case: general-purpose lookups",
+    "",
+    "3. vector SoA+SIMD (parallel key and value vectors, SIMD key scan)",
+    "   - Lookup complexity: O(n)",
+    "   - Ordered: depends on implementation",
+    "   - Use case: cheapest inserts and memory; lookups lose to hashing at every size",
+    "",
+    "4. flat_hash_map (SwissTable-style open addressing)",
+    "   - Lookup complexity: O(1) average, 16 slots probed per SIMD compare",
+    "   - Ordered: no",
+    "   - Use case: lookup-heavy workloads on large tables (>100k elements)",
+    "",
+    "Recommendation: std::unordered_map for most cases, flat_hash_map for large lookup-heavy tables",
+    "",
+])
+
+RESULTS_MENU_TEXT = "\n".join([
+    "",
+    "=== View results ===",
+    "[1] All results",
+    "[2] Task 1 results",
+    "[3] Task 2 results",
+    "[4] Task 3 results",
+    "[0] Back to main menu",
+    "",
+])
+
+RESULTS_TABLE_HEADER = (
+    f"\n{'Date/Time':<20} {'Task':<30} {'Method':<30} {'Time (ns)':<15} {'Threads':<10}\n"
+    + "-" * 105 + "\n"
+)
+
+# Filled in with the expected server path
+ASIO_SERVER_MISSING_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "ERROR: Server executable not found: {path}",
+    "=" * 70,
+    "To build the server, run:",
+    "  mkdir -p build && cd build && cmake .. && make",
+    "=" * 70,
+    "",
+    "",
+])
+
+ASIO_SERVER_BANNER_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "Starting Boost.Asio HTTP Server",
+    "=" * 70,
+    "Server URL: http://localhost:8080",
+    "",
+    "Available endpoints:",
+    "  GET /health              - Server status",
+    "  GET /benchmark/task1     - weak_ptr::lock() benchmark",
+    "  GET /benchmark/task2?size=N - Vector erase benchmark",
+    "  GET /benchmark/task3?size=N - Mapping benchmark",
+    "  GET /results             - Results from DB",
+    "",
+    "Press Ctrl+C to stop the server",
+    "=" * 70,
+    "",
+    "",
+])
+
+RUN_ALL_HEADER_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "Running All Tasks - Complete Demonstration",
+    "=" * 70,
+    "",
+])
+
+RUN_ALL_SUMMARY_HEADER_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "Summary of Results",
+    "=" * 70,
+    "",
+])
+
+AUTORUN_HEADER_TEXT = "\n".join([
+    "=" * 50,
+    "C++ Benchmark Kit - Automatic mode",
+    "=" * 50,
+    "",
+])
+
+# Row templates for the benchmark tables, parsed once instead of per row
+RESULTS_ROW = (
+    "{ts:<20} {task_name:<30} {method_name:<30} "
+    "{execution_time_ns:<15} {thread_count:<10}"
+)
+
+TASK2_TABLE_HEADER = "\n".join([
+    "",
+    "=" * 80,
+    f"{'Method':<25} {'Time (ms)':<15} {'Ops/sec':<20}",
+    "=" * 80,
+    "",
+])
+TASK2_ROW = "{:<25} {:>12.2f}  {:>15,.0f}{}"
+
+TASK3_TABLE_HEADER = "\n".join([
+    "",
+    "=" * 100,
+    f"{'Container':<28} {'Insert (ms)':<15} {'Lookup (ms)':<15} {'Erase (ms)':<15} {'Memory (MB)':<15}",
+    "=" * 100,
+    "",
+])
+TASK3_ROW = "{:<28} {:>12.2f}  {:>12.2f}  {:>12.2f}  {:>12.2f}{}"
+
+SUMMARY_ROW = "  {:<20} {:>10.2f} {}"
+SUMMARY_ERROR_ROW = "  {:<20} {}"
 
 
 class BenchmarkConsole:
     def __init__(self):
-        self.db = DatabaseManager()
+        self._db = None
         self.running = True
+        # Set by --profile when hardware counters are available
+        self.profile = False
+        # Set by --concurrent to run a task's methods side by side
+        self.concurrent = False
+
+    @property
+    def db(self):
+        """DatabaseManager, connected on first access"""
+        if self._db is None:
+            self._db = _get_database_manager()()
+        return self._db
+
+    def _benchmark(self, name: str, benchmark_func):
+        """benchmark_func, reporting hardware counters when profiling"""
+        return profiled(name, benchmark_func) if self.profile else benchmark_func
+
+    def _run_benchmarks(self, methods, *args) -> list:
+        """Results of every method, run one at a time unless --concurrent"""
+        if self.concurrent:
+            return run_benchmarks_concurrently(methods, *args)
+        return run_benchmarks_serially(methods, *args)
+
+    def close(self):
+        """Close DB connection if one was opened"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
     def check_cpp_module(self) -> bool:
         """
@@ -102,42 +535,28 @@ class BenchmarkConsole:
             True if module is loaded, False otherwise.
             If False, prints warning and build instructions.
         """
-        if not CPP_MODULE_AVAILABLE:
-            print("\n" + "=" * 70)
-            print("WARNING: C++ module is not available")
-            print("=" * 70)
-            print("To build the C++ module, run:")
-            print("  mkdir -p build && cd build && cmake .. && make")
-            print("=" * 70 + "\n")
-        return CPP_MODULE_AVAILABLE
+        available = _get_cpp() is not None
+        if not available:
+            sys.stdout.write(CPP_MISSING_TEXT)
+        return available
 
     def print_menu(self):
         """Print main menu"""
-        print("\n" + "=" * 50)
-        print("C++ Benchmark Kit - Main Menu")
-        print("=" * 50)
-        print("[1] Example 1: weak_ptr::lock() implementation")
-        print("[2] Example 2: Remove every second element from vector")
-        print("[3] Example 3: Mapping integer to string")
-        print("[4] Run all benchmarks")
-        print("[5] View results from DB")
-        print("[6] Start REST API server")
-        print("[0] Exit")
-        print("=" * 50)
+        sys.stdout.write(MAIN_MENU_TEXT)
 
     def get_user_input(self, prompt: str, default: Optional[str] = None) -> str:
         """Get input from user"""
         global _shutdown_requested
         if _shutdown_requested:
             raise KeyboardInterrupt()
+        # Plain blocking input(); the signal handlers above interrupt it
         try:
-            if default:
-                user_input = interruptible_input(f"{prompt} [{default}]: ").strip()
-                return user_input if user_input else default
-            return interruptible_input(f"{prompt}: ").strip()
+            user_input = input(f"{prompt} [{default}]: " if default else f"{prompt}: ").strip()
         except EOFError:
-            # Handle EOF (e.g., when stdin is closed)
             raise KeyboardInterrupt()
+        if default:
+            return user_input if user_input else default
+        return user_input
 
     def get_int_input(self, prompt: str, default: int, min_value: int = None) -> int:
         """Get integer input from user with optional minimum value validation"""
@@ -154,12 +573,7 @@ class BenchmarkConsole:
 
     def task1_menu(self):
         """Task 1 menu"""
-        print("\n=== Task 1: weak_ptr::lock() ===")
-        print("Demonstration of reference counter implementation")
-        print("\n[1] Show implementation source code")
-        print("[2] Run demonstration")
-        print("[3] Run benchmark")
-        print("[0] Back to main menu")
+        sys.stdout.write(TASK1_MENU_TEXT)
         
         choice = self.get_user_input("Select option", "0")
         
@@ -179,8 +593,19 @@ class BenchmarkConsole:
         code_path = "src/examples/weak_ptr/custom_weak_ptr.hpp"
         if os.path.exists(code_path):
             print(f"\n=== Source code: {code_path} ===\n")
-            with open(code_path, 'r', encoding='utf-8') as f:
-                print(f.read())
+            # Stream the file in chunks; raw bytes when stdout has a binary
+            # buffer, text otherwise (e.g. redirected to StringIO)
+            out = getattr(sys.stdout, "buffer", None)
+            if out is not None:
+                sys.stdout.flush()
+                with open(code_path, 'rb') as f:
+                    shutil.copyfileobj(f, out, COPY_CHUNK_SIZE)
+                out.write(b"\n")
+                out.flush()
+            else:
+                with open(code_path, 'r', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, sys.stdout, COPY_CHUNK_SIZE)
+                sys.stdout.write("\n")
         else:
             print(f"File {code_path} not found")
 
@@ -191,7 +616,7 @@ class BenchmarkConsole:
         
         print("\nRunning demonstration...")
         try:
-            cpp.demonstrate_weak_ptr_lock()
+            _get_cpp().demonstrate_weak_ptr_lock()
         except Exception as e:
             print(f"Error running demonstration: {e}")
 
@@ -206,39 +631,27 @@ class BenchmarkConsole:
         print(f"\nRunning benchmark: iterations={iterations}, threads={thread_count}")
 
         try:
-            execution_time_ns = cpp.benchmark_weak_ptr_lock(iterations, thread_count)
+            execution_time_ns = _get_cpp().benchmark_weak_ptr_lock(iterations, thread_count)
 
             # Display results
-            execution_time_ms = execution_time_ns / 1e6
-            operations_per_second = iterations / (execution_time_ns / 1e9)
+            execution_time_ms = execution_time_ns * 1e-6
+            operations_per_second = iterations * 1e9 / execution_time_ns
 
             print("\nResults:")
             print(f"  Execution time: {execution_time_ms:.2f} ms")
             print(f"  Operations per second: {operations_per_second:,.0f}")
 
-            if self.db.is_connected():
-                self.db.save_benchmark_result(
-                    task_number=1,
-                    task_name="weak_ptr::lock()",
-                    method_name="CustomWeakPtr::lock()",
-                    execution_time_ns=execution_time_ns,
-                    parameters={"iterations": iterations},
-                    thread_count=thread_count,
-                    operations_per_second=operations_per_second,
-                )
+            # save_* return False without a connection, so no separate check
+            if self.db.save_benchmark_result(
+                **task1_row(execution_time_ns, iterations, thread_count, operations_per_second)
+            ):
                 print("  ✓ Results saved to DB")
         except Exception as e:
             print(f"Error running benchmark: {e}")
 
     def task2_menu(self):
         """Task 2 menu"""
-        print("\n=== Task 2: Remove every second element ===")
-        print("[1] Erase in loop method (naive)")
-        print("[2] remove_if + erase method")
-        print("[3] Iterators method")
-        print("[4] Copy to new vector method")
-        print("[5] Run comparative benchmark of all methods")
-        print("[0] Back to main menu")
+        sys.stdout.write(TASK2_MENU_TEXT)
 
         choice = self.get_user_input("Select option", "0")
 
@@ -247,7 +660,7 @@ class BenchmarkConsole:
         elif choice in ["1", "2", "3", "4"]:
             if self.check_cpp_module():
                 try:
-                    cpp.demonstrate_vector_erase()
+                    _get_cpp().demonstrate_vector_erase()
                 except Exception as e:
                     print(f"Error running demonstration: {e}")
         elif choice == "0":
@@ -267,60 +680,43 @@ class BenchmarkConsole:
         print("\nRunning comparative benchmark...")
         print(f"Vector size: {vector_size}, Iterations: {iterations}, Threads: {thread_count}")
         
-        # Define methods with their benchmark functions
-        methods = [
-            ("Naive erase", "naive_erase", cpp.benchmark_naive_erase),
-            ("remove_if + erase", "remove_if_erase", cpp.benchmark_remove_if_erase),
-            ("Iterators", "iterators_erase", cpp.benchmark_iterators_erase),
-            ("Copy to new vector", "copy_erase", cpp.benchmark_copy_erase),
-            ("Partition", "partition_erase", cpp.benchmark_partition_erase)
-        ]
+        methods = task2_benchmarks()
         
-        results = []
+        # One slot per method, filled by index
+        results = [None] * len(methods)
         
         try:
-            for method_name, method_key, benchmark_func in methods:
-                execution_time_ns = benchmark_func(vector_size, iterations, thread_count)
-                execution_time_ms = execution_time_ns / 1e6
-                operations_per_second = iterations / (execution_time_ns / 1e9)
-                results.append((method_name, method_key, execution_time_ns, execution_time_ms, operations_per_second))
+            fastest_time_ns = float('inf')
+            fastest_idx = -1
+            times_ns = self._run_benchmarks(methods, vector_size, iterations, thread_count)
+            for i, ((method_name, method_key, _), execution_time_ns) in enumerate(zip(methods, times_ns)):
+                execution_time_ms = execution_time_ns * 1e-6
+                operations_per_second = iterations * 1e9 / execution_time_ns
+                results[i] = (method_name, method_key, execution_time_ns, execution_time_ms, operations_per_second)
+                if execution_time_ns < fastest_time_ns:
+                    fastest_time_ns, fastest_idx = execution_time_ns, i
             
             # Display results table
-            print("\n" + "=" * 80)
-            print(f"{'Method':<25} {'Time (ms)':<15} {'Ops/sec':<20}")
-            print("=" * 80)
+            sys.stdout.write(TASK2_TABLE_HEADER)
             
-            fastest_time_ns = min(r[2] for r in results)
-            
-            for method_name, method_key, execution_time_ns, execution_time_ms, ops_per_sec in results:
-                is_fastest = execution_time_ns == fastest_time_ns
-                marker = " ⭐ FASTEST" if is_fastest else ""
-                print(f"{method_name:<25} {execution_time_ms:>12.2f}  {ops_per_sec:>15,.0f}{marker}")
+            for i, (method_name, _, _, execution_time_ms, ops_per_sec) in enumerate(results):
+                marker = " ⭐ FASTEST" if i == fastest_idx else ""
+                print(TASK2_ROW.format(method_name, execution_time_ms, ops_per_sec, marker))
             
             print("=" * 80)
             
             # Save to DB
-            if self.db.is_connected():
-                for method_name, method_key, execution_time_ns, _, ops_per_sec in results:
-                    self.db.save_benchmark_result(
-                        task_number=2,
-                        task_name="Vector erase",
-                        method_name=method_key,
-                        execution_time_ns=execution_time_ns,
-                        parameters={"vector_size": vector_size, "iterations": iterations},
-                        thread_count=thread_count,
-                        operations_per_second=ops_per_sec
-                    )
+            timings = [(r[1], r[2], r[4]) for r in results]
+            if self.db.save_benchmark_results_bulk(
+                task2_rows(timings, vector_size, iterations, thread_count, self.concurrent)
+            ):
                 print("\n✓ Results saved to DB (5 methods)")
         except Exception as e:
             print(f"Error running benchmark: {e}")
 
     def task3_menu(self):
         """Task 3 menu"""
-        print("\n=== Task 3: Mapping number to string ===")
-        print("[1] Show container analysis")
-        print("[2] Run comparative benchmark")
-        print("[0] Back to main menu")
+        sys.stdout.write(TASK3_MENU_TEXT)
         
         choice = self.get_user_input("Select option", "0")
         
@@ -333,23 +729,7 @@ class BenchmarkConsole:
 
     def show_task3_analysis(self):
         """Show container analysis"""
-        print("\n=== Container analysis for int -> string mapping ===\n")
-        print("1. std::map<int, std::string>")
-        print("   - Lookup complexity: O(log n)")
-        print("   - Ordered: yes")
-        print("   - Use case: when ordering is needed")
-        print()
-        print("2. std::unordered_map<int, std::string>")
-        print("   - Lookup complexity: O(1) average, O(n) worst")
-        print("   - Ordered: no")
-        print("   - Use case: for maximum lookup performance")
-        print()
-        print("3. std::vector<std::pair<int, std::string>>")
-        print("   - Lookup complexity: O(n)")
-        print("   - Ordered: depends on implementation")
-        print("   - Use case: for small datasets (<100 elements)")
-        print()
-        print("Recommendation: std::unordered_map for most cases")
+        sys.stdout.write(TASK3_ANALYSIS_TEXT)
 
     def run_task3_benchmark(self):
         """Run task 3 benchmark"""
@@ -365,62 +745,35 @@ class BenchmarkConsole:
         print(f"Elements: {element_count}, Lookup iterations: {lookup_iterations}")
         
         try:
-            # Call benchmark functions that return BenchmarkResult objects
-            map_result = cpp.benchmark_map(element_count, lookup_iterations)
-            umap_result = cpp.benchmark_unordered_map(element_count, lookup_iterations)
-            vec_result = cpp.benchmark_vector(element_count, lookup_iterations)
-            
-            results = [
-                map_result,
-                umap_result,
-                vec_result
-            ]
+            # Each container returns a BenchmarkResult
+            results = self._run_benchmarks(task3_benchmarks(), element_count, lookup_iterations)
             
             # Display results table
-            print("\n" + "=" * 100)
-            print(f"{'Container':<25} {'Insert (ms)':<15} {'Lookup (ms)':<15} {'Erase (ms)':<15} {'Memory (MB)':<15}")
-            print("=" * 100)
+            sys.stdout.write(TASK3_TABLE_HEADER)
             
-            fastest_lookup_time_ns = min(r.lookup_time_ns for r in results)
+            fastest_idx = min(range(len(results)), key=lambda i: results[i].lookup_time_ns)
+            fastest_container = results[fastest_idx]
             
-            for result in results:
-                insert_ms = result.insert_time_ns / 1e6
-                lookup_ms = result.lookup_time_ns / 1e6
-                erase_ms = result.erase_time_ns / 1e6
+            for i, result in enumerate(results):
+                insert_ms = result.insert_time_ns * 1e-6
+                lookup_ms = result.lookup_time_ns * 1e-6
+                erase_ms = result.erase_time_ns * 1e-6
                 memory_mb = result.memory_usage_bytes / (1024 * 1024)
                 
-                is_fastest = result.lookup_time_ns == fastest_lookup_time_ns
-                marker = " ⭐ FASTEST LOOKUP" if is_fastest else ""
+                marker = " ⭐ FASTEST LOOKUP" if i == fastest_idx else ""
                 
-                print(f"{result.container_name:<25} {insert_ms:>12.2f}  {lookup_ms:>12.2f}  {erase_ms:>12.2f}  {memory_mb:>12.2f}{marker}")
+                print(TASK3_ROW.format(result.container_name, insert_ms, lookup_ms, erase_ms, memory_mb, marker))
             
             print("=" * 100)
             
             # Display recommendation
-            fastest_container = min(results, key=lambda r: r.lookup_time_ns)
             print(f"\nRecommendation: Use {fastest_container.container_name} for fastest lookup performance")
             
             # Save to DB
-            if self.db.is_connected():
-                for result in results:
-                    parameters = {
-                        "element_count": element_count,
-                        "lookup_iterations": lookup_iterations,
-                        "insert_time_ns": result.insert_time_ns,
-                        "erase_time_ns": result.erase_time_ns,
-                        "memory_usage_bytes": result.memory_usage_bytes
-                    }
-                    
-                    self.db.save_benchmark_result(
-                        task_number=3,
-                        task_name="Mapping benchmark",
-                        method_name=result.container_name,
-                        execution_time_ns=result.lookup_time_ns,  # Primary metric
-                        parameters=parameters,
-                        thread_count=1,
-                        operations_per_second=lookup_iterations / (result.lookup_time_ns / 1e9)
-                    )
-                print("\n✓ Results saved to DB (3 containers)")
+            if self.db.save_benchmark_results_bulk(
+                task3_rows(results, element_count, lookup_iterations, self.concurrent)
+            ):
+                print(f"\n✓ Results saved to DB ({len(results)} containers)")
         except Exception as e:
             print(f"Error running benchmark: {e}")
 
@@ -430,12 +783,7 @@ class BenchmarkConsole:
             print("DB not connected")
             return
 
-        print("\n=== View results ===")
-        print("[1] All results")
-        print("[2] Task 1 results")
-        print("[3] Task 2 results")
-        print("[4] Task 3 results")
-        print("[0] Back to main menu")
+        sys.stdout.write(RESULTS_MENU_TEXT)
         
         choice = self.get_user_input("Select option", "0")
         
@@ -449,49 +797,27 @@ class BenchmarkConsole:
         elif choice == "0":
             return
 
-        results = self.db.get_results(task_number=task_number, limit=50)
+        results = self.db.get_results_summary(task_number=task_number, limit=50)
         
         if not results:
             print("No saved results")
             return
 
-        print(f"\n{'Date/Time':<20} {'Task':<30} {'Method':<30} {'Time (ns)':<15} {'Threads':<10}")
-        print("-" * 105)
-        for result in results:
-            timestamp = result['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-            print(f"{timestamp:<20} {result['task_name']:<30} {result['method_name']:<30} "
-                  f"{result['execution_time_ns']:<15} {result['thread_count']:<10}")
+        # Build the whole table and emit it in one write
+        lines = [RESULTS_ROW.format_map(r) for r in results]
+        sys.stdout.write(RESULTS_TABLE_HEADER + "\n".join(lines) + "\n")
 
     def run_asio_server(self):
         """Start Boost.Asio server"""
-        # Determine server executable path relative to script location
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(script_dir)
-        server_path = os.path.join(project_root, "build", "asio_server")
+        server_path = _SERVER_PATH
         
         # Check if executable exists
         if not os.path.exists(server_path):
-            print(f"\n{'=' * 70}")
-            print(f"ERROR: Server executable not found: {server_path}")
-            print(f"{'=' * 70}")
-            print("To build the server, run:")
-            print("  mkdir -p build && cd build && cmake .. && make")
-            print(f"{'=' * 70}\n")
+            sys.stdout.write(ASIO_SERVER_MISSING_TEXT.format(path=server_path))
             return
         
         # Display server information
-        print("\n" + "=" * 70)
-        print("Starting Boost.Asio HTTP Server")
-        print("=" * 70)
-        print("Server URL: http://localhost:8080")
-        print("\nAvailable endpoints:")
-        print("  GET /health              - Server status")
-        print("  GET /benchmark/task1     - weak_ptr::lock() benchmark")
-        print("  GET /benchmark/task2?size=N - Vector erase benchmark")
-        print("  GET /benchmark/task3?size=N - Mapping benchmark")
-        print("  GET /results             - Results from DB")
-        print("\nPress Ctrl+C to stop the server")
-        print("=" * 70 + "\n")
+        sys.stdout.write(ASIO_SERVER_BANNER_TEXT)
         
         # Start server process
         try:
@@ -499,15 +825,24 @@ class BenchmarkConsole:
                 [server_path],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                bufsize=1,
-                universal_newlines=True
             )
             
-            # Stream output with prefix
-            try:
-                for line in process.stdout:
-                    print(f"[server] {line.rstrip()}")
+            # Stream raw output chunks with prefix; text fallback when
+            # stdout has no binary buffer
+            out = getattr(sys.stdout, "buffer", None)
+            if out is not None:
+                sys.stdout.flush()
+
+                def write(data: bytes):
+                    out.write(data)
+                    out.flush()
+            else:
+                def write(data: bytes):
+                    sys.stdout.write(data.decode("utf-8", "replace"))
                     sys.stdout.flush()
+
+            try:
+                pump_prefixed_output(process.stdout.fileno(), write)
             except KeyboardInterrupt:
                 print("\n\nStopping server...")
                 process.terminate()
@@ -532,9 +867,7 @@ class BenchmarkConsole:
         if not self.check_cpp_module():
             return
         
-        print("\n" + "=" * 70)
-        print("Running All Tasks - Complete Demonstration")
-        print("=" * 70)
+        sys.stdout.write(RUN_ALL_HEADER_TEXT)
         
         # Default parameters
         task1_iterations = 1000000
@@ -552,27 +885,21 @@ class BenchmarkConsole:
         print("-" * 70)
         try:
             print("Running demonstration...")
-            cpp.demonstrate_weak_ptr_lock()
-            time.sleep(0.5)
+            _get_cpp().demonstrate_weak_ptr_lock()
+            if _INTERACTIVE:
+                time.sleep(0.5)
             
             print(f"\nRunning benchmark: iterations={task1_iterations}, threads={task1_threads}")
-            execution_time_ns = cpp.benchmark_weak_ptr_lock(task1_iterations, task1_threads)
-            execution_time_ms = execution_time_ns / 1e6
-            operations_per_second = task1_iterations / (execution_time_ns / 1e9)
+            execution_time_ns = _get_cpp().benchmark_weak_ptr_lock(task1_iterations, task1_threads)
+            execution_time_ms = execution_time_ns * 1e-6
+            operations_per_second = task1_iterations * 1e9 / execution_time_ns
             
             print(f"  ✓ Execution time: {execution_time_ms:.2f} ms")
             print(f"  ✓ Operations per second: {operations_per_second:,.0f}")
             
-            if self.db.is_connected():
-                self.db.save_benchmark_result(
-                    task_number=1,
-                    task_name="weak_ptr::lock()",
-                    method_name="CustomWeakPtr::lock()",
-                    execution_time_ns=execution_time_ns,
-                    parameters={"iterations": task1_iterations},
-                    thread_count=task1_threads,
-                    operations_per_second=operations_per_second
-                )
+            if self.db.save_benchmark_result(
+                **task1_row(execution_time_ns, task1_iterations, task1_threads, operations_per_second)
+            ):
                 print("  ✓ Results saved to DB")
             
             results_summary.append(("Task 1", execution_time_ms, "ms"))
@@ -580,91 +907,57 @@ class BenchmarkConsole:
             print(f"  ⚠ Error: {e}")
             results_summary.append(("Task 1", "ERROR", ""))
         
-        time.sleep(1)
-        
         # Task 2: Benchmark
         print("\n📌 Task 2: Vector erase")
         print("-" * 70)
         print(f"Running benchmark: vector_size={task2_vector_size}, iterations={task2_iterations}, threads={task2_threads}")
         
-        methods = [
-            ("Naive erase", "naive_erase", cpp.benchmark_naive_erase),
-            ("remove_if + erase", "remove_if_erase", cpp.benchmark_remove_if_erase),
-            ("Iterators", "iterators_erase", cpp.benchmark_iterators_erase),
-            ("Copy to new vector", "copy_erase", cpp.benchmark_copy_erase),
-            ("Partition", "partition_erase", cpp.benchmark_partition_erase)
-        ]
+        methods = task2_benchmarks()
         
-        task2_results = []
+        task2_results = [None] * len(methods)
         try:
-            for method_name, method_key, benchmark_func in methods:
+            fastest = None
+            for i, (method_name, method_key, benchmark_func) in enumerate(methods):
                 execution_time_ns = benchmark_func(task2_vector_size, task2_iterations, task2_threads)
-                execution_time_ms = execution_time_ns / 1e6
-                operations_per_second = task2_iterations / (execution_time_ns / 1e9)
-                task2_results.append((method_name, method_key, execution_time_ns, execution_time_ms, operations_per_second))
-            
-            fastest_time_ns = min(r[2] for r in task2_results)
-            fastest_method = next(r[0] for r in task2_results if r[2] == fastest_time_ns)
+                execution_time_ms = execution_time_ns * 1e-6
+                operations_per_second = task2_iterations * 1e9 / execution_time_ns
+                row = (method_name, method_key, execution_time_ns, execution_time_ms, operations_per_second)
+                task2_results[i] = row
+                if fastest is None or execution_time_ns < fastest[2]:
+                    fastest = row
             
-            print(f"  ✓ Fastest method: {fastest_method} ({min(r[3] for r in task2_results):.2f} ms)")
+            fastest_method, _, _, fastest_ms, _ = fastest
+            print(f"  ✓ Fastest method: {fastest_method} ({fastest_ms:.2f} ms)")
             
-            if self.db.is_connected():
-                for method_name, method_key, execution_time_ns, _, ops_per_sec in task2_results:
-                    self.db.save_benchmark_result(
-                        task_number=2,
-                        task_name="Vector erase",
-                        method_name=method_key,
-                        execution_time_ns=execution_time_ns,
-                        parameters={"vector_size": task2_vector_size, "iterations": task2_iterations},
-                        thread_count=task2_threads,
-                        operations_per_second=ops_per_sec
-                    )
+            timings = [(r[1], r[2], r[4]) for r in task2_results]
+            if self.db.save_benchmark_results_bulk(
+                task2_rows(timings, task2_vector_size, task2_iterations, task2_threads)
+            ):
                 print("  ✓ Results saved to DB (5 methods)")
             
-            results_summary.append(("Task 2", min(r[3] for r in task2_results), "ms (fastest)"))
+            results_summary.append(("Task 2", fastest_ms, "ms (fastest)"))
         except Exception as e:
             print(f"  ⚠ Error: {e}")
             results_summary.append(("Task 2", "ERROR", ""))
         
-        time.sleep(1)
-        
         # Task 3: Benchmark
         print("\n📌 Task 3: Mapping int→string")
         print("-" * 70)
         print(f"Running benchmark: elements={task3_element_count}, lookup_iterations={task3_lookup_iterations}")
         
         try:
-            map_result = cpp.benchmark_map(task3_element_count, task3_lookup_iterations)
-            umap_result = cpp.benchmark_unordered_map(task3_element_count, task3_lookup_iterations)
-            vec_result = cpp.benchmark_vector(task3_element_count, task3_lookup_iterations)
-            
-            results = [map_result, umap_result, vec_result]
-            fastest_lookup_time_ns = min(r.lookup_time_ns for r in results)
+            results = [
+                benchmark_func(task3_element_count, task3_lookup_iterations)
+                for _, _, benchmark_func in task3_benchmarks()
+            ]
             fastest_container = min(results, key=lambda r: r.lookup_time_ns)
-            
-            fastest_lookup_ms = fastest_lookup_time_ns / 1e6
+            fastest_lookup_ms = fastest_container.lookup_time_ns * 1e-6
             print(f"  ✓ Fastest container: {fastest_container.container_name} ({fastest_lookup_ms:.2f} ms)")
             
-            if self.db.is_connected():
-                for result in results:
-                    parameters = {
-                        "element_count": task3_element_count,
-                        "lookup_iterations": task3_lookup_iterations,
-                        "insert_time_ns": result.insert_time_ns,
-                        "erase_time_ns": result.erase_time_ns,
-                        "memory_usage_bytes": result.memory_usage_bytes
-                    }
-                    
-                    self.db.save_benchmark_result(
-                        task_number=3,
-                        task_name="Mapping benchmark",
-                        method_name=result.container_name,
-                        execution_time_ns=result.lookup_time_ns,
-                        parameters=parameters,
-                        thread_count=1,
-                        operations_per_second=task3_lookup_iterations / (result.lookup_time_ns / 1e9)
-                    )
-                print("  ✓ Results saved to DB (3 containers)")
+            if self.db.save_benchmark_results_bulk(
+                task3_rows(results, task3_element_count, task3_lookup_iterations)
+            ):
+                print(f"  ✓ Results saved to DB ({len(results)} containers)")
             
             results_summary.append(("Task 3", fastest_lookup_ms, "ms (fastest lookup)"))
         except Exception as e:
@@ -672,38 +965,35 @@ class BenchmarkConsole:
             results_summary.append(("Task 3", "ERROR", ""))
         
         # Display summary
-        print("\n" + "=" * 70)
-        print("Summary of Results")
-        print("=" * 70)
+        sys.stdout.write(RUN_ALL_SUMMARY_HEADER_TEXT)
         for task_name, value, unit in results_summary:
             if value == "ERROR":
-                print(f"  {task_name:<20} {value}")
+                print(SUMMARY_ERROR_ROW.format(task_name, value))
             else:
-                print(f"  {task_name:<20} {value:>10.2f} {unit}")
+                print(SUMMARY_ROW.format(task_name, value, unit))
         print("=" * 70 + "\n")
 
     def run_task1_benchmark_auto(self, iterations: int, threads: int):
         """Auto run task 1 benchmark"""
         print(f"  Iterations: {iterations}, Threads: {threads}")
         
-        if not CPP_MODULE_AVAILABLE:
+        if _get_cpp() is None:
             print("  ⚠ C++ module not available, skipping benchmark")
             return
+
+        # Results are only persisted, so there is nothing to do without DB
+        if not self.db.is_connected():
+            print("  ⚠ DB not connected, skipping benchmark")
+            return
         
         try:
-            execution_time_ns = cpp.benchmark_weak_ptr_lock(iterations, threads)
-            operations_per_second = iterations / (execution_time_ns / 1e9)
+            benchmark = self._benchmark("weak_ptr::lock()", _get_cpp().benchmark_weak_ptr_lock)
+            execution_time_ns = benchmark(iterations, threads)
+            operations_per_second = iterations * 1e9 / execution_time_ns
             
-            if self.db.is_connected():
-                self.db.save_benchmark_result(
-                    task_number=1,
-                    task_name="weak_ptr::lock()",
-                    method_name="CustomWeakPtr::lock()",
-                    execution_time_ns=execution_time_ns,
-                    parameters={"iterations": iterations},
-                    thread_count=threads,
-                    operations_per_second=operations_per_second
-                )
+            if self.db.save_benchmark_result(
+                **task1_row(execution_time_ns, iterations, threads, operations_per_second)
+            ):
                 print("  ✓ Results saved to DB")
         except Exception as e:
             print(f"  ⚠ Error running benchmark: {e}")
@@ -712,34 +1002,31 @@ class BenchmarkConsole:
         """Auto run task 2 benchmark"""
         print(f"  Vector size: {vector_size}, Iterations: {iterations}, Threads: {threads}")
         
-        if not CPP_MODULE_AVAILABLE:
+        if _get_cpp() is None:
             print("  ⚠ C++ module not available, skipping benchmark")
             return
+
+        # Results are only persisted, so there is nothing to do without DB
+        if not self.db.is_connected():
+            print("  ⚠ DB not connected, skipping benchmark")
+            return
         
-        methods = [
-            ("naive_erase", cpp.benchmark_naive_erase),
-            ("remove_if_erase", cpp.benchmark_remove_if_erase),
-            ("iterators_erase", cpp.benchmark_iterators_erase),
-            ("copy_erase", cpp.benchmark_copy_erase),
-            ("partition_erase", cpp.benchmark_partition_erase)
-        ]
+        methods = tuple(
+            (name, key, self._benchmark(name, func)) for name, key, func in task2_benchmarks()
+        )
         
         try:
-            for method_name, benchmark_func in methods:
-                execution_time_ns = benchmark_func(vector_size, iterations, threads)
-                operations_per_second = iterations / (execution_time_ns / 1e9)
-                
-                if self.db.is_connected():
-                    self.db.save_benchmark_result(
-                        task_number=2,
-                        task_name="Vector erase",
-                        method_name=method_name,
-                        execution_time_ns=execution_time_ns,
-                        parameters={"vector_size": vector_size, "iterations": iterations},
-                        thread_count=threads,
-                        operations_per_second=operations_per_second
-                    )
-            print("  ✓ Results saved to DB (5 methods)")
+            times_ns = self._run_benchmarks(methods, vector_size, iterations, threads)
+            timings = zip(
+                (method_key for _, method_key, _ in methods),
+                times_ns,
+                ops_per_second(iterations, times_ns),
+            )
+            
+            if self.db.save_benchmark_results_bulk(
+                task2_rows(timings, vector_size, iterations, threads, self.concurrent)
+            ):
+                print("  ✓ Results saved to DB (5 methods)")
         except Exception as e:
             print(f"  ⚠ Error running benchmark: {e}")
 
@@ -747,68 +1034,59 @@ class BenchmarkConsole:
         """Auto run task 3 benchmark"""
         print(f"  Elements: {element_count}, Lookup iterations: {lookup_iterations}")
         
-        if not CPP_MODULE_AVAILABLE:
+        if _get_cpp() is None:
             print("  ⚠ C++ module not available, skipping benchmark")
             return
+
+        # Results are only persisted, so there is nothing to do without DB
+        if not self.db.is_connected():
+            print("  ⚠ DB not connected, skipping benchmark")
+            return
         
         try:
-            # Call benchmark functions that return BenchmarkResult objects
-            map_result = cpp.benchmark_map(element_count, lookup_iterations)
-            umap_result = cpp.benchmark_unordered_map(element_count, lookup_iterations)
-            vec_result = cpp.benchmark_vector(element_count, lookup_iterations)
-            
-            results = [map_result, umap_result, vec_result]
+            # Each container returns a BenchmarkResult
+            methods = tuple(
+                (name, key, self._benchmark(name, func)) for name, key, func in task3_benchmarks()
+            )
+            results = self._run_benchmarks(methods, element_count, lookup_iterations)
             
-            for result in results:
-                parameters = {
-                    "element_count": element_count,
-                    "lookup_iterations": lookup_iterations,
-                    "insert_time_ns": result.insert_time_ns,
-                    "erase_time_ns": result.erase_time_ns,
-                    "memory_usage_bytes": result.memory_usage_bytes
-                }
-                
-                if self.db.is_connected():
-                    self.db.save_benchmark_result(
-                        task_number=3,
-                        task_name="Mapping benchmark",
-                        method_name=result.container_name,
-                        execution_time_ns=result.lookup_time_ns,  # Primary metric
-                        parameters=parameters,
-                        thread_count=1,
-                        operations_per_second=lookup_iterations / (result.lookup_time_ns / 1e9)
-                    )
-            print("  ✓ Results saved to DB (3 containers)")
+            if self.db.save_benchmark_results_bulk(
+                task3_rows(results, element_count, lookup_iterations, self.concurrent)
+            ):
+                print(f"  ✓ Results saved to DB ({len(results)} containers)")
         except Exception as e:
             print(f"  ⚠ Error running benchmark: {e}")
 
+    def _exit(self):
+        """Leave the main loop"""
+        print("Exiting...")
+        self.running = False
+
     def run(self):
         """Main loop"""
         global _shutdown_requested
+        # Built here rather than in __init__ so handlers patched on the
+        # instance before run() are the ones dispatched to
+        handlers = {
+            "1": self.task1_menu,
+            "2": self.task2_menu,
+            "3": self.task3_menu,
+            "4": self.run_all_tasks,
+            "5": self.show_results,
+            "6": self.run_asio_server,
+            "0": self._exit,
+        }
         while self.running and not _shutdown_requested:
             self.print_menu()
             choice = self.get_user_input("Select option", "0")
             
-            if choice == "1":
-                self.task1_menu()
-            elif choice == "2":
-                self.task2_menu()
-            elif choice == "3":
-                self.task3_menu()
-            elif choice == "4":
-                self.run_all_tasks()
-            elif choice == "5":
-                self.show_results()
-            elif choice == "6":
-                self.run_asio_server()
-            elif choice == "0":
-                print("Exiting...")
-                self.running = False
+            handler = handlers.get(choice)
+            if handler is not None:
+                handler()
             else:
                 print("Invalid choice. Please enter a number from 0 to 6")
 
-        if self.db:
-            self.db.close()
+        self.close()
 
 
 def main():
@@ -825,17 +1103,28 @@ def main():
                         help='Number of threads (default: 1)')
     parser.add_argument('--vector-size', '-s', type=int, default=100000,
                         help='Vector size for task 2 (default: 100000)')
+    parser.add_argument('--profile', action='store_true',
+                        help='With --autorun/--task, print IPC and cache/branch MPKI per benchmark')
+    parser.add_argument('--concurrent', action='store_true',
+                        help='Run the methods of a task side by side (faster, but timings contend '
+                             'for cores and are flagged as concurrent in the DB)')
     
     args = parser.parse_args()
     
     console = BenchmarkConsole()
+    console.concurrent = args.concurrent
     
     try:
         if args.autorun or args.task:
             # Automatic mode
-            print("=" * 50)
-            print("C++ Benchmark Kit - Automatic mode")
-            print("=" * 50)
+            sys.stdout.write(AUTORUN_HEADER_TEXT)
+            
+            if args.profile:
+                cpp = _get_cpp()
+                if cpp is not None and cpp.PerfCounters().available:
+                    console.profile = True
+                else:
+                    print("⚠ Hardware counters unavailable (perf_event_open refused), not profiling")
             
             if args.task == 1 or args.autorun:
                 print("\n📌 Task 1: weak_ptr::lock()")
@@ -857,8 +1146,7 @@ def main():
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
     finally:
-        if console.db:
-            console.db.close()
+        console.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for db_manager.py - write and read paths against a live database
+
+Run once per driver: plain pytest uses psycopg 3, DB_DRIVER=psycopg2 hides
+it so the psycopg2 fallback kept for the transition is exercised (conftest.py).
+"""
+import csv
+import io
+import json
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+import db_manager
+from db_manager import DatabaseManager, OperationalError
+
+# Task number reserved for these tests; its rows are removed afterwards
+TEST_TASK = 900
+
+
+@pytest.fixture(scope="module")
+def db():
+    """One pool for the module, skipping every test when no database is reachable"""
+    manager = DatabaseManager(min_size=1)
+    if not manager.is_connected():
+        pytest.skip("DB not connected")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def clean_db(db):
+    """db with no TEST_TASK rows before and after the test"""
+    def delete(conn):
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM benchmark_results WHERE task_number = %s", (TEST_TASK,))
+
+    db._retry_once(delete)
+    yield db
+    db._retry_once(delete)
+
+
+def _row(method_name="m", execution_time_ns=1000, **overrides):
+    """One save_benchmark_result() argument dict for TEST_TASK"""
+    row = {
+        "task_number": TEST_TASK,
+        "task_name": "DB test",
+        "method_name": method_name,
+        "execution_time_ns": execution_time_ns,
+        "parameters": {"vector_size": 10, "iterations": 5},
+        "thread_count": 1,
+        "operations_per_second": 2.5,
+    }
+    row.update(overrides)
+    return row
+
+
+def _stats(db):
+    """TEST_TASK statistics keyed by (method, build type)"""
+    return {(s["method_name"], s["build_type"]): s for s in db.get_task_statistics(TEST_TASK)}
+
+
+class TestWrites:
+    """Every insert path stores the row it was given"""
+
+    def test_save_benchmark_result_round_trip(self, clean_db):
+        """Promoted parameters come back folded into parameters"""
+        assert clean_db.save_benchmark_result(**_row(notes="single"))
+
+        [result] = clean_db.get_results(task_number=TEST_TASK, limit=10)
+        assert result["method_name"] == "m"
+        assert result["parameters"] == {"vector_size": 10, "iterations": 5}
+        assert result["notes"] == "single"
+        assert result["build_type"] == db_manager.get_build_type()
+
+    def test_bulk_save(self, clean_db):
+        """One batch, rows with and without parameters"""
+        rows = [_row("a"), _row("b", parameters=None)]
+        assert clean_db.save_benchmark_results_bulk(rows)
+
+        results = clean_db.get_results(task_number=TEST_TASK, limit=10)
+        assert sorted(r["method_name"] for r in results) == ["a", "b"]
+        assert {r["method_name"]: r["parameters"] for r in results}["b"] is None
+
+    @pytest.mark.skipif(db_manager.HAS_PSYCOPG3, reason="psycopg2 only")
+    def test_bulk_save_without_execute_values(self, clean_db):
+        """Old psycopg2 builds fall back to mogrified multi-row INSERTs"""
+        with patch.object(db_manager, "execute_values", None):
+            assert clean_db.save_benchmark_results_bulk([_row("a"), _row("b")])
+
+        assert len(clean_db.get_results(task_number=TEST_TASK, limit=10)) == 2
+
+    def test_copy_benchmark_results(self, clean_db):
+        """Batches of COPY_MIN_ROWS and more go through COPY FROM STDIN"""
+        rows = [_row("copy", i + 1) for i in range(db_manager.COPY_MIN_ROWS)]
+        rows[0]["notes"] = 'comma, "quote"'
+        assert clean_db.copy_benchmark_results(rows)
+
+        stats = _stats(clean_db)[("copy", db_manager.get_build_type())]
+        assert stats["count"] == db_manager.COPY_MIN_ROWS
+        assert stats["min_time_ns"] == 1
+        assert stats["max_time_ns"] == db_manager.COPY_MIN_ROWS
+
+    def test_failed_write_is_not_retried(self, db):
+        """A write that lost its connection may have committed; it is not replayed"""
+        operation = Mock(side_effect=OperationalError("connection lost"))
+        with patch.object(db, "_reconnect"):
+            with pytest.raises(OperationalError):
+                db._retry_once(operation, idempotent=False)
+        operation.assert_called_once()
+
+    def test_failed_read_is_retried_once(self, db):
+        """Reads are retried on a fresh connection"""
+        operation = Mock(side_effect=[OperationalError("connection lost"), "rows"])
+        with patch.object(db, "_reconnect"):
+            assert db._retry_once(operation) == "rows"
+        assert operation.call_count == 2
+
+
+class TestStatistics:
+    """benchmark_stats follows every change to benchmark_results"""
+
+    def test_delete_and_update_recompute_totals(self, clean_db):
+        """Removing a group's minimum and moving rows between groups"""
+        clean_db.save_benchmark_results_bulk(
+            [_row("m", 100), _row("m", 200), _row("m", 300, build_type="Debug")]
+        )
+        build = db_manager.get_build_type()
+
+        def change(conn):
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM benchmark_results "
+                    "WHERE task_number = %s AND execution_time_ns = 100", (TEST_TASK,))
+                cur.execute(
+                    "UPDATE benchmark_results SET build_type = NULL "
+                    "WHERE task_number = %s AND build_type = 'Debug'", (TEST_TASK,))
+
+        clean_db._retry_once(change)
+
+        stats = _stats(clean_db)
+        assert set(stats) == {("m", build), ("m", None)}
+        assert stats[("m", build)]["count"] == 1
+        assert stats[("m", build)]["min_time_ns"] == 200
+        assert stats[("m", None)]["max_time_ns"] == 300
+
+
+class TestReads:
+    """Export and notification paths"""
+
+    def test_export_results_csv(self, clean_db):
+        """Header plus one row per result, parameters as JSON text"""
+        clean_db.save_benchmark_results_bulk([_row("a"), _row("b")])
+
+        buf = io.BytesIO()
+        assert clean_db.export_results_csv(buf, task_number=TEST_TASK) == 2
+
+        rows = list(csv.DictReader(io.StringIO(buf.getvalue().decode())))
+        assert sorted(r["method_name"] for r in rows) == ["a", "b"]
+        assert json.loads(rows[0]["parameters"]) == {"vector_size": 10, "iterations": 5}
+
+    def test_listen_wakes_on_insert(self, clean_db):
+        """Inserts notify RESULTS_CHANNEL once per statement"""
+        with clean_db.listen() as wait:
+            assert not wait(0)
+            saver = threading.Thread(target=clean_db.save_benchmark_result, kwargs=_row())
+            saver.start()
+            assert wait(10)
+            saver.join()
+            assert not wait(0)
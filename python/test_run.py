@@ -2,318 +2,297 @@
 """
 Tests for run.py - Task 2.2, 2.3, 2.4 integration tests
 """
-import sys
 import os
+import importlib.util
 import pytest
+from contextlib import ExitStack
+from dataclasses import dataclass
 from unittest.mock import Mock, patch
 import json
 
-# Add path to modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from run import BenchmarkConsole, CPP_MODULE_AVAILABLE, cpp
 
+requires_cpp = pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
+requires_benchmark = pytest.mark.skipif(importlib.util.find_spec("pytest_benchmark") is None,
+                                        reason="pytest-benchmark not installed")
 
-class TestTask1Methods:
-    """Tests for Task 1 methods (Task 2.2)"""
+# Fixed rounds keep the default suite fast; compare runs with --benchmark-autosave
+PERF_ROUNDS = 50
+
+
+@pytest.fixture(scope="module")
+def console():
+    """One console (and DB pool) shared by the module; tests patch it with patch.object"""
+    shared = BenchmarkConsole()
+    yield shared
+    shared.close()
+
+
+@pytest.fixture
+def db_console(console):
+    """The shared console, skipping the test when no database is reachable"""
+    if not console.db.is_connected():
+        pytest.skip("DB not connected")
+    return console
+
+
+# Distinct erase times so the fastest method is unambiguous
+TASK2_TIMES = {
+    'benchmark_naive_erase': 100000000,
+    'benchmark_remove_if_erase': 50000000,
+    'benchmark_iterators_erase': 80000000,
+    'benchmark_copy_erase': 30000000,
+    'benchmark_partition_erase': 25000000,
+}
+
+
+def _patch_cpp(stack, **return_values):
+    """
+    Swap the bindings run.py sees for one mock for the life of stack.
+
+    Named functions return the given values; everything else is passed
+    through to the real module (wraps), and spec rejects misspelt names.
+    Returns the configured function mocks by name.
+    """
+    module = Mock(spec=cpp, wraps=cpp)
+    for name, value in return_values.items():
+        getattr(module, name).return_value = value
+    stack.enter_context(patch('run._cpp', module))
+    return {name: getattr(module, name) for name in return_values}
+
+
+@dataclass
+class _FakeBenchResult:
+    """Stand-in for a task 3 BenchmarkResult (only read, so no Mock needed)"""
+    # Spelled out rather than slots=True, which needs Python 3.10
+    __slots__ = ('container_name', 'insert_time_ns', 'lookup_time_ns', 'erase_time_ns',
+                 'memory_usage_bytes')
+    container_name: str
+    insert_time_ns: int
+    lookup_time_ns: int
+    erase_time_ns: int
+    memory_usage_bytes: int
+
+
+# Results for every task 3 container, flat_hash_map fastest
+TASK3_RESULTS = {
+    'benchmark_map': _FakeBenchResult("std::map (arena)", 10000000, 5000000, 8000000, 1000000),
+    'benchmark_unordered_map': _FakeBenchResult(
+        "std::unordered_map (arena)", 8000000, 2000000, 6000000, 1200000),
+    'benchmark_vector': _FakeBenchResult(
+        "vector SoA+SIMD", 5000000, 15000000, 10000000, 800000),
+    'benchmark_flat_hash': _FakeBenchResult("flat_hash_map", 6000000, 1000000, 4000000, 900000),
+}
+
+
+class TestWithoutModule:
+    """Every entry point returns early when the C++ module is missing"""
     
-    def test_run_task1_demo_without_module(self):
-        """TC-E2E-03: Error handling when module missing"""
-        console = BenchmarkConsole()
-        
-        # Mock check_cpp_module to return False
+    @pytest.mark.parametrize("method", [
+        "run_task1_demo",
+        "run_task1_benchmark",
+        "run_task2_benchmark",
+        "run_task3_benchmark",
+        "run_all_tasks",
+    ])
+    def test_method_without_cpp_module(self, console, method):
+        """TC-E2E-03/04/05: Error handling when module missing"""
         with patch.object(console, 'check_cpp_module', return_value=False):
-            # Should not crash, just return
-            console.run_task1_demo()
-            # No exception should be raised
+            # Should return without crashing
+            getattr(console, method)()
+
+
+class TestTask1Methods:
+    """Tests for Task 1 methods (Task 2.2)"""
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task1_demo_with_module(self):
+    @requires_cpp
+    def test_run_task1_demo_with_module(self, console):
         """TC-E2E-01: Task 1 demonstration runs"""
-        console = BenchmarkConsole()
-        
         # Mock demonstrate_weak_ptr_lock to avoid actual output
-        if CPP_MODULE_AVAILABLE:
-            with patch.object(cpp, 'demonstrate_weak_ptr_lock') as mock_demo:
-                console.run_task1_demo()
-                mock_demo.assert_called_once()
+        with patch.object(cpp, 'demonstrate_weak_ptr_lock') as mock_demo:
+            console.run_task1_demo()
+            mock_demo.assert_called_once()
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task1_benchmark_with_module(self):
+    @requires_cpp
+    def test_run_task1_benchmark_with_module(self, console, capsys):
         """TC-E2E-02: Task 1 benchmark returns real time"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
-            # Mock benchmark function to return realistic time
-            mock_time_ns = 50000000  # 50 ms
-            with patch.object(cpp, 'benchmark_weak_ptr_lock', return_value=mock_time_ns):
-                with patch.object(console, 'get_int_input', side_effect=[1000000, 1]):
-                    with patch.object(console.db, 'is_connected', return_value=False):
-                        # Capture output
-                        import io
-                        from contextlib import redirect_stdout
-                        f = io.StringIO()
-                        with redirect_stdout(f):
-                            console.run_task1_benchmark()
-                        output = f.getvalue()
-                        
-                        # Check that execution time is displayed
-                        assert "Execution time" in output or "ms" in output
-                        assert "Operations per second" in output or "Ops/sec" in output
-    
-    def test_run_task1_benchmark_without_module(self):
-        """Test benchmark handling when module missing"""
-        console = BenchmarkConsole()
-        
-        with patch.object(console, 'check_cpp_module', return_value=False):
-            console.run_task1_benchmark()
-            # Should return without crashing
+        # Mock benchmark function to return realistic time
+        mock_time_ns = 50000000  # 50 ms
+        with patch.object(cpp, 'benchmark_weak_ptr_lock', return_value=mock_time_ns):
+            with patch.object(console, 'get_int_input', side_effect=[1000000, 1]):
+                with patch.object(console.db, 'is_connected', return_value=False):
+                    console.run_task1_benchmark()
+                    output = capsys.readouterr().out
+                    
+                    # Check that execution time is displayed
+                    assert "Execution time" in output or "ms" in output
+                    assert "Operations per second" in output or "Ops/sec" in output
 
 
 class TestTask2Methods:
     """Tests for Task 2 methods (Task 2.3)"""
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_task2_menu_demonstration(self):
+    @requires_cpp
+    def test_task2_menu_demonstration(self, console):
         """TC-E2E-01: Task 2 demonstration runs"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
-            with patch.object(cpp, 'demonstrate_vector_erase') as mock_demo:
-                with patch.object(console, 'get_user_input', return_value='1'):
-                    with patch.object(console, 'check_cpp_module', return_value=True):
-                        console.task2_menu()
-                        mock_demo.assert_called_once()
+        with patch.object(cpp, 'demonstrate_vector_erase') as mock_demo:
+            with patch.object(console, 'get_user_input', return_value='1'):
+                with patch.object(console, 'check_cpp_module', return_value=True):
+                    console.task2_menu()
+                    mock_demo.assert_called_once()
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task2_benchmark_calls_all_methods(self):
+    @requires_cpp
+    def test_run_task2_benchmark_calls_all_methods(self, console, capsys):
         """TC-E2E-02: Task 2 comparative benchmark runs"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
+        with ExitStack() as stack:
             # Mock all benchmark functions
-            mock_times = [100000000, 50000000, 80000000, 30000000, 25000000]  # Different times
-            
-            with patch.object(cpp, 'benchmark_naive_erase', return_value=mock_times[0]):
-                with patch.object(cpp, 'benchmark_remove_if_erase', return_value=mock_times[1]):
-                    with patch.object(cpp, 'benchmark_iterators_erase', return_value=mock_times[2]):
-                        with patch.object(cpp, 'benchmark_copy_erase', return_value=mock_times[3]):
-                            with patch.object(cpp, 'benchmark_partition_erase', return_value=mock_times[4]):
-                                with patch.object(console, 'get_int_input', side_effect=[100000, 100, 1]):
-                                    with patch.object(console, 'check_cpp_module', return_value=True):
-                                        with patch.object(console.db, 'is_connected', return_value=False):
-                                            import io
-                                            from contextlib import redirect_stdout
-                                            f = io.StringIO()
-                                            with redirect_stdout(f):
-                                                console.run_task2_benchmark()
-                                            output = f.getvalue()
-                                            
-                                            # Check that all methods are called
-                                            assert "Naive erase" in output or "naive" in output.lower()
-                                            assert "remove_if" in output.lower() or "remove" in output.lower()
-                                            assert "Iterators" in output or "iterators" in output.lower()
-                                            assert "Copy" in output or "copy" in output.lower()
-                                            assert "Partition" in output or "partition" in output.lower()
-                                            assert "FASTEST" in output
-    
-    def test_run_task2_benchmark_without_module(self):
-        """TC-E2E-04: Error handling when module missing"""
-        console = BenchmarkConsole()
+            _patch_cpp(stack, **TASK2_TIMES)
+            stack.enter_context(patch.object(console, 'get_int_input', side_effect=[100000, 100, 1]))
+            stack.enter_context(patch.object(console, 'check_cpp_module', return_value=True))
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_task2_benchmark()
+            output = capsys.readouterr().out
         
-        with patch.object(console, 'check_cpp_module', return_value=False):
+        # Check that all methods are called
+        assert "Naive erase" in output or "naive" in output.lower()
+        assert "remove_if" in output.lower() or "remove" in output.lower()
+        assert "Iterators" in output or "iterators" in output.lower()
+        assert "Copy" in output or "copy" in output.lower()
+        assert "Partition" in output or "partition" in output.lower()
+        assert "FASTEST" in output
+    
+    @requires_cpp
+    def test_run_task2_benchmark_concurrent(self, console, capsys):
+        """--concurrent runs the same methods side by side"""
+        with ExitStack() as stack:
+            mocks = _patch_cpp(stack, **TASK2_TIMES)
+            stack.enter_context(patch.object(console, 'concurrent', True))
+            stack.enter_context(patch.object(console, 'get_int_input', side_effect=[100000, 100, 1]))
+            stack.enter_context(patch.object(console, 'check_cpp_module', return_value=True))
+            save = stack.enter_context(patch.object(console.db, 'save_benchmark_results_bulk'))
             console.run_task2_benchmark()
-            # Should return without crashing
+            output = capsys.readouterr().out
+        
+        assert all(mocks[name].call_count == 1 for name in TASK2_TIMES)
+        assert "FASTEST" in output
+        # Concurrent timings are flagged so they are not mixed up with serial ones
+        rows = save.call_args.args[0]
+        assert all(row["parameters"]["concurrent"] for row in rows)
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task2_benchmark_saves_to_db(self):
+    @requires_cpp
+    def test_run_task2_benchmark_saves_to_db(self, db_console):
         """TC-E2E-03: Benchmark results are saved to DB"""
-        console = BenchmarkConsole()
+        console = db_console
+        with ExitStack() as stack:
+            _patch_cpp(stack, **TASK2_TIMES)
+            stack.enter_context(patch.object(console, 'get_int_input', side_effect=[100000, 100, 1]))
+            stack.enter_context(patch.object(console, 'check_cpp_module', return_value=True))
+            bulk = stack.enter_context(patch.object(
+                console.db, 'save_benchmark_results_bulk',
+                wraps=console.db.save_benchmark_results_bulk))
+            console.run_task2_benchmark()
         
-        if CPP_MODULE_AVAILABLE and console.db.is_connected():
-            mock_times = [100000000, 50000000, 80000000, 30000000, 25000000]
-            
-            with patch.object(cpp, 'benchmark_naive_erase', return_value=mock_times[0]):
-                with patch.object(cpp, 'benchmark_remove_if_erase', return_value=mock_times[1]):
-                    with patch.object(cpp, 'benchmark_iterators_erase', return_value=mock_times[2]):
-                        with patch.object(cpp, 'benchmark_copy_erase', return_value=mock_times[3]):
-                            with patch.object(cpp, 'benchmark_partition_erase', return_value=mock_times[4]):
-                                with patch.object(console, 'get_int_input', side_effect=[100000, 100, 1]):
-                                    with patch.object(console, 'check_cpp_module', return_value=True):
-                                        console.run_task2_benchmark()
-                                        
-                                        # Check that results were saved
-                                        results = console.db.get_results(task_number=2, limit=5)
-                                        assert len(results) >= 5
-                                        
-                                        # Check that execution times are real (not hardcoded)
-                                        for result in results:
-                                            assert result['execution_time_ns'] > 0
-                                            assert result['execution_time_ns'] != 1000000000  # Not stub value
+        # All five rows go out in one batch
+        bulk.assert_called_once()
+        assert len(bulk.call_args[0][0]) == 5
+        
+        # Check that results were saved
+        results = console.db.get_results(task_number=2, limit=5)
+        assert len(results) >= 5
+        
+        # Check that execution times are real (not hardcoded)
+        for result in results:
+            assert result['execution_time_ns'] > 0
+            assert result['execution_time_ns'] != 1000000000  # Not stub value
 
 
 class TestTask3Methods:
     """Tests for Task 3 methods (Task 2.4)"""
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task3_benchmark_displays_all_metrics(self):
+    @requires_cpp
+    def test_run_task3_benchmark_displays_all_metrics(self, console, capsys):
         """TC-E2E-01: Task 3 benchmark displays all metrics"""
-        console = BenchmarkConsole()
+        with ExitStack() as stack:
+            # Mock BenchmarkResult objects
+            _patch_cpp(stack, **TASK3_RESULTS)
+            stack.enter_context(patch.object(console, 'get_int_input', side_effect=[100000, 1000000]))
+            stack.enter_context(patch.object(console, 'check_cpp_module', return_value=True))
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_task3_benchmark()
+            output = capsys.readouterr().out
         
-        if CPP_MODULE_AVAILABLE:
-            # Create mock BenchmarkResult objects
-            mock_map_result = Mock()
-            mock_map_result.container_name = "std::map"
-            mock_map_result.insert_time_ns = 10000000
-            mock_map_result.lookup_time_ns = 5000000
-            mock_map_result.erase_time_ns = 8000000
-            mock_map_result.memory_usage_bytes = 1000000
-            
-            mock_umap_result = Mock()
-            mock_umap_result.container_name = "std::unordered_map"
-            mock_umap_result.insert_time_ns = 8000000
-            mock_umap_result.lookup_time_ns = 2000000
-            mock_umap_result.erase_time_ns = 6000000
-            mock_umap_result.memory_usage_bytes = 1200000
-            
-            mock_vec_result = Mock()
-            mock_vec_result.container_name = "std::vector<pair>"
-            mock_vec_result.insert_time_ns = 5000000
-            mock_vec_result.lookup_time_ns = 15000000
-            mock_vec_result.erase_time_ns = 10000000
-            mock_vec_result.memory_usage_bytes = 800000
-            
-            with patch.object(cpp, 'benchmark_map', return_value=mock_map_result):
-                with patch.object(cpp, 'benchmark_unordered_map', return_value=mock_umap_result):
-                    with patch.object(cpp, 'benchmark_vector', return_value=mock_vec_result):
-                        with patch.object(console, 'get_int_input', side_effect=[100000, 1000000]):
-                            with patch.object(console, 'check_cpp_module', return_value=True):
-                                with patch.object(console.db, 'is_connected', return_value=False):
-                                    import io
-                                    from contextlib import redirect_stdout
-                                    f = io.StringIO()
-                                    with redirect_stdout(f):
-                                        console.run_task3_benchmark()
-                                    output = f.getvalue()
-                                    
-                                    # Check that all metrics are displayed
-                                    assert "std::map" in output
-                                    assert "std::unordered_map" in output
-                                    assert "std::vector" in output or "vector" in output.lower()
-                                    assert "Insert" in output or "insert" in output.lower()
-                                    assert "Lookup" in output or "lookup" in output.lower()
-                                    assert "Erase" in output or "erase" in output.lower()
-                                    assert "Memory" in output or "memory" in output.lower()
-                                    assert "FASTEST" in output or "Recommendation" in output
+        # Check that all metrics are displayed
+        assert "std::map (arena)" in output
+        assert "std::unordered_map (arena)" in output
+        assert "vector SoA+SIMD" in output
+        assert "Insert" in output or "insert" in output.lower()
+        assert "Lookup" in output or "lookup" in output.lower()
+        assert "Erase" in output or "erase" in output.lower()
+        assert "Memory" in output or "memory" in output.lower()
+        assert "FASTEST" in output or "Recommendation" in output
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task3_benchmark_recommendation(self):
+    @requires_cpp
+    def test_run_task3_benchmark_recommendation(self, console, capsys):
         """TC-E2E-02: Recommendation is based on real data"""
-        console = BenchmarkConsole()
+        # Mock results that differ only in lookup time; unordered_map is fastest
+        with ExitStack() as stack:
+            _patch_cpp(
+                stack,
+                benchmark_map=_FakeBenchResult("std::map (arena)", 10000000, 5000000, 8000000, 1000000),
+                benchmark_unordered_map=_FakeBenchResult(
+                    "std::unordered_map (arena)", 10000000, 2000000, 8000000, 1000000),
+                benchmark_vector=_FakeBenchResult(
+                    "vector SoA+SIMD", 10000000, 15000000, 8000000, 1000000),
+                benchmark_flat_hash=_FakeBenchResult(
+                    "flat_hash_map", 10000000, 3000000, 8000000, 1000000),
+            )
+            stack.enter_context(patch.object(console, 'get_int_input', side_effect=[100000, 1000000]))
+            stack.enter_context(patch.object(console, 'check_cpp_module', return_value=True))
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_task3_benchmark()
+            output = capsys.readouterr().out
         
-        if CPP_MODULE_AVAILABLE:
-            # Create mock results where unordered_map is fastest
-            mock_umap_result = Mock()
-            mock_umap_result.container_name = "std::unordered_map"
-            mock_umap_result.lookup_time_ns = 2000000  # Fastest
-            
-            mock_map_result = Mock()
-            mock_map_result.container_name = "std::map"
-            mock_map_result.lookup_time_ns = 5000000
-            
-            mock_vec_result = Mock()
-            mock_vec_result.container_name = "std::vector<pair>"
-            mock_vec_result.lookup_time_ns = 15000000
-            
-            # Set other fields
-            for result in [mock_map_result, mock_umap_result, mock_vec_result]:
-                result.insert_time_ns = 10000000
-                result.erase_time_ns = 8000000
-                result.memory_usage_bytes = 1000000
-            
-            with patch.object(cpp, 'benchmark_map', return_value=mock_map_result):
-                with patch.object(cpp, 'benchmark_unordered_map', return_value=mock_umap_result):
-                    with patch.object(cpp, 'benchmark_vector', return_value=mock_vec_result):
-                        with patch.object(console, 'get_int_input', side_effect=[100000, 1000000]):
-                            with patch.object(console, 'check_cpp_module', return_value=True):
-                                with patch.object(console.db, 'is_connected', return_value=False):
-                                    import io
-                                    from contextlib import redirect_stdout
-                                    f = io.StringIO()
-                                    with redirect_stdout(f):
-                                        console.run_task3_benchmark()
-                                    output = f.getvalue()
-                                    
-                                    # Check that unordered_map is recommended
-                                    assert "unordered_map" in output.lower() or "Recommendation" in output
+        # Check that unordered_map is recommended
+        assert "Recommendation: Use std::unordered_map (arena)" in output
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task3_benchmark_saves_to_db(self):
+    @requires_cpp
+    def test_run_task3_benchmark_saves_to_db(self, db_console):
         """TC-E2E-03: Benchmark results are saved to DB with JSON parameters"""
-        console = BenchmarkConsole()
+        console = db_console
+        with ExitStack() as stack:
+            _patch_cpp(stack, **TASK3_RESULTS)
+            stack.enter_context(patch.object(console, 'get_int_input', side_effect=[100000, 1000000]))
+            stack.enter_context(patch.object(console, 'check_cpp_module', return_value=True))
+            bulk = stack.enter_context(patch.object(
+                console.db, 'save_benchmark_results_bulk',
+                wraps=console.db.save_benchmark_results_bulk))
+            console.run_task3_benchmark()
         
-        if CPP_MODULE_AVAILABLE and console.db.is_connected():
-            mock_map_result = Mock()
-            mock_map_result.container_name = "std::map"
-            mock_map_result.insert_time_ns = 10000000
-            mock_map_result.lookup_time_ns = 5000000
-            mock_map_result.erase_time_ns = 8000000
-            mock_map_result.memory_usage_bytes = 1000000
-            
-            mock_umap_result = Mock()
-            mock_umap_result.container_name = "std::unordered_map"
-            mock_umap_result.insert_time_ns = 8000000
-            mock_umap_result.lookup_time_ns = 2000000
-            mock_umap_result.erase_time_ns = 6000000
-            mock_umap_result.memory_usage_bytes = 1200000
-            
-            mock_vec_result = Mock()
-            mock_vec_result.container_name = "std::vector<pair>"
-            mock_vec_result.insert_time_ns = 5000000
-            mock_vec_result.lookup_time_ns = 15000000
-            mock_vec_result.erase_time_ns = 10000000
-            mock_vec_result.memory_usage_bytes = 800000
-            
-            with patch.object(cpp, 'benchmark_map', return_value=mock_map_result):
-                with patch.object(cpp, 'benchmark_unordered_map', return_value=mock_umap_result):
-                    with patch.object(cpp, 'benchmark_vector', return_value=mock_vec_result):
-                        with patch.object(console, 'get_int_input', side_effect=[100000, 1000000]):
-                            with patch.object(console, 'check_cpp_module', return_value=True):
-                                console.run_task3_benchmark()
-                                
-                                # Check that results were saved
-                                results = console.db.get_results(task_number=3, limit=3)
-                                assert len(results) >= 3
-                                
-                                # Check that parameters contain all metrics
-                                for result in results:
-                                    params = json.loads(result['parameters']) if isinstance(result['parameters'], str) else result['parameters']
-                                    assert 'insert_time_ns' in params
-                                    assert 'erase_time_ns' in params
-                                    assert 'memory_usage_bytes' in params
-                                    assert 'element_count' in params
-                                    assert 'lookup_iterations' in params
-    
-    def test_run_task3_benchmark_without_module(self):
-        """Test benchmark handling when module missing"""
-        console = BenchmarkConsole()
+        # One batch for every container
+        bulk.assert_called_once()
         
-        with patch.object(console, 'check_cpp_module', return_value=False):
-            console.run_task3_benchmark()
-            # Should return without crashing
+        # Check that results were saved
+        results = console.db.get_results(task_number=3, limit=len(TASK3_RESULTS))
+        assert len(results) >= len(TASK3_RESULTS)
+        
+        # Check that parameters contain all metrics
+        for result in results:
+            params = json.loads(result['parameters']) if isinstance(result['parameters'], str) else result['parameters']
+            assert 'insert_time_ns' in params
+            assert 'erase_time_ns' in params
+            assert 'memory_usage_bytes' in params
+            assert 'element_count' in params
+            assert 'lookup_iterations' in params
 
 
 class TestBenchmarkResultAccess:
     """Tests for BenchmarkResult struct access (Task 2.4)"""
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
+    @requires_cpp
     def test_benchmark_result_fields_accessible(self):
         """TC-E2E-04: BenchmarkResult fields are accessible"""
-        if not CPP_MODULE_AVAILABLE:
-            pytest.skip("C++ module not available")
-        
-        # Call actual benchmark function
-        result = cpp.benchmark_map(1000, 1000)
+        # Call actual benchmark function; one element is enough to fill every field
+        result = cpp.benchmark_map(1, 1)
         
         # Check that all fields are accessible
         assert hasattr(result, 'container_name')
@@ -333,85 +312,94 @@ class TestBenchmarkResultAccess:
 class TestAutoRunMethods:
     """Tests for auto-run methods"""
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task1_benchmark_auto(self):
+    @requires_cpp
+    def test_run_task1_benchmark_auto(self, console):
         """Test auto-run for Task 1"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
-            mock_time_ns = 50000000
-            with patch.object(cpp, 'benchmark_weak_ptr_lock', return_value=mock_time_ns):
-                with patch.object(console.db, 'is_connected', return_value=False):
-                    console.run_task1_benchmark_auto(1000000, 1)
-                    # Should not crash
+        mock_time_ns = 50000000
+        with patch.object(cpp, 'benchmark_weak_ptr_lock', return_value=mock_time_ns):
+            with patch.object(console.db, 'is_connected', return_value=False):
+                console.run_task1_benchmark_auto(1000000, 1)
+                # Should not crash
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task2_benchmark_auto(self):
+    @requires_cpp
+    def test_run_task2_benchmark_auto(self, console):
         """Test auto-run for Task 2"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
-            mock_times = [100000000, 50000000, 80000000, 30000000, 25000000]
-            
-            with patch.object(cpp, 'benchmark_naive_erase', return_value=mock_times[0]):
-                with patch.object(cpp, 'benchmark_remove_if_erase', return_value=mock_times[1]):
-                    with patch.object(cpp, 'benchmark_iterators_erase', return_value=mock_times[2]):
-                        with patch.object(cpp, 'benchmark_copy_erase', return_value=mock_times[3]):
-                            with patch.object(cpp, 'benchmark_partition_erase', return_value=mock_times[4]):
-                                with patch.object(console.db, 'is_connected', return_value=False):
-                                    console.run_task2_benchmark_auto(100000, 100, 1)
-                                    # Should not crash
+        with ExitStack() as stack:
+            _patch_cpp(stack, **TASK2_TIMES)
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_task2_benchmark_auto(100000, 100, 1)
+            # Should not crash
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_task3_benchmark_auto(self):
+    @requires_cpp
+    def test_run_task3_benchmark_auto(self, console):
         """Test auto-run for Task 3"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
-            mock_map_result = Mock()
-            mock_map_result.container_name = "std::map"
-            mock_map_result.insert_time_ns = 10000000
-            mock_map_result.lookup_time_ns = 5000000
-            mock_map_result.erase_time_ns = 8000000
-            mock_map_result.memory_usage_bytes = 1000000
-            
-            mock_umap_result = Mock()
-            mock_umap_result.container_name = "std::unordered_map"
-            mock_umap_result.insert_time_ns = 8000000
-            mock_umap_result.lookup_time_ns = 2000000
-            mock_umap_result.erase_time_ns = 6000000
-            mock_umap_result.memory_usage_bytes = 1200000
-            
-            mock_vec_result = Mock()
-            mock_vec_result.container_name = "std::vector<pair>"
-            mock_vec_result.insert_time_ns = 5000000
-            mock_vec_result.lookup_time_ns = 15000000
-            mock_vec_result.erase_time_ns = 10000000
-            mock_vec_result.memory_usage_bytes = 800000
-            
-            with patch.object(cpp, 'benchmark_map', return_value=mock_map_result):
-                with patch.object(cpp, 'benchmark_unordered_map', return_value=mock_umap_result):
-                    with patch.object(cpp, 'benchmark_vector', return_value=mock_vec_result):
-                        with patch.object(console.db, 'is_connected', return_value=False):
-                            console.run_task3_benchmark_auto(100000, 1000000)
-                            # Should not crash
+        with ExitStack() as stack:
+            _patch_cpp(stack, **TASK3_RESULTS)
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_task3_benchmark_auto(100000, 1000000)
+            # Should not crash
+
+    @requires_cpp
+    def test_profiled_prints_ipc_and_mpki(self, capsys):
+        """--profile wraps benchmarks and reports counters per call"""
+        from run import profiled
+
+        values = Mock(cycles=2000, instructions=4000, cache_misses=8, branch_misses=2)
+        counters = Mock()
+        counters.stop.return_value = values
+        benchmark = Mock(return_value=123)
+
+        with patch.object(cpp, 'PerfCounters', return_value=counters):
+            assert profiled("naive", benchmark)(10, 1) == 123
+
+        benchmark.assert_called_once_with(10, 1)
+        counters.start.assert_called_once()
+        line = capsys.readouterr().out
+        assert "naive" in line
+        assert "IPC  2.00" in line
+        assert "cache MPKI    2.00" in line
+        assert "branch MPKI   0.50" in line
+
+
+class TestPerfHotPaths:
+    """Timings of the Python glue around the auto-run benchmarks (C++ and DB stubbed)"""
+
+    @staticmethod
+    def _stub_db(stack, console):
+        stack.enter_context(patch.object(console.db, 'is_connected', return_value=True))
+        stack.enter_context(patch.object(console.db, 'save_benchmark_result', return_value=True))
+        stack.enter_context(patch.object(console.db, 'save_benchmark_results_bulk', return_value=True))
+
+    @requires_cpp
+    @requires_benchmark
+    def test_perf_task2_glue(self, console, benchmark):
+        """Task 2 dispatch, ops/sec and row building"""
+        with ExitStack() as stack:
+            _patch_cpp(stack, **TASK2_TIMES)
+            self._stub_db(stack, console)
+            benchmark.pedantic(console.run_task2_benchmark_auto, args=(100, 100, 1),
+                               rounds=PERF_ROUNDS)
+
+    @requires_cpp
+    @requires_benchmark
+    def test_perf_task3_glue(self, console, benchmark):
+        """Task 3 dispatch and row building from BenchmarkResult objects"""
+        with ExitStack() as stack:
+            _patch_cpp(stack, **TASK3_RESULTS)
+            self._stub_db(stack, console)
+            benchmark.pedantic(console.run_task3_benchmark_auto, args=(100, 100),
+                               rounds=PERF_ROUNDS)
 
 
 class TestAsioServer:
     """Tests for Boost.Asio server launcher (Task 2.5)"""
     
-    def test_run_asio_server_missing_executable(self):
+    def test_run_asio_server_missing_executable(self, console, capsys):
         """TC-E2E-03: Error when executable missing"""
-        console = BenchmarkConsole()
-        
         # Mock os.path.exists to return False
         with patch('os.path.exists', return_value=False):
-            import io
-            from contextlib import redirect_stdout
-            f = io.StringIO()
-            with redirect_stdout(f):
-                console.run_asio_server()
-            output = f.getvalue()
+            console.run_asio_server()
+            output = capsys.readouterr().out
             
             # Check error message
             assert "ERROR" in output or "not found" in output.lower()
@@ -419,42 +407,34 @@ class TestAsioServer:
     
     @pytest.mark.skipif(not os.path.exists(os.path.join(os.path.dirname(os.path.dirname(__file__)), "build", "asio_server")), 
                         reason="asio_server executable not built")
-    def test_run_asio_server_displays_info(self):
+    def test_run_asio_server_displays_info(self, console):
         """TC-E2E-01: Server info banner is displayed"""
-        console = BenchmarkConsole()
-        
         # Mock subprocess.Popen to avoid actually starting server
         mock_process = Mock()
-        mock_process.stdout = iter(["Server started\n", "Listening on port 8080\n"])
+        mock_process.stdout.fileno.return_value = 0
         mock_process.wait = Mock(return_value=0)
         
         with patch('subprocess.Popen', return_value=mock_process):
-            import io
-            from contextlib import redirect_stdout
-            f = io.StringIO()
-            with redirect_stdout(f):
-                # Simulate KeyboardInterrupt after a short time
-                def interrupt_after_read():
-                    raise KeyboardInterrupt()
-                
-                # Mock the stdout iteration to raise KeyboardInterrupt
-                mock_process.stdout = iter(["Server started\n"])
-                with patch('builtins.print'):
-                    try:
-                        console.run_asio_server()
-                    except KeyboardInterrupt:
-                        pass
+            # Simulate KeyboardInterrupt after a short time
+            def interrupt_after_read():
+                raise KeyboardInterrupt()
+            
+            # Mock the stdout reads to end after one chunk
+            with patch('builtins.print'), \
+                    patch('os.read', side_effect=[b"Server started\n", b""]):
+                try:
+                    console.run_asio_server()
+                except KeyboardInterrupt:
+                    pass
             
             # Check that server info was displayed
             # Since we're mocking, we check that Popen was called
             # In real scenario, we'd check output for server info
     
-    def test_run_asio_server_handles_keyboard_interrupt(self):
+    def test_run_asio_server_handles_keyboard_interrupt(self, console, capsys):
         """TC-E2E-02: Server stops on Ctrl+C"""
-        console = BenchmarkConsole()
-        
         mock_process = Mock()
-        mock_process.stdout = iter(["Server started\n"])
+        mock_process.stdout.fileno.return_value = 0
         mock_process.wait = Mock(return_value=0)
         mock_process.terminate = Mock()
         mock_process.kill = Mock()
@@ -462,149 +442,85 @@ class TestAsioServer:
         with patch('os.path.exists', return_value=True):
             with patch('subprocess.Popen', return_value=mock_process):
                 # Simulate KeyboardInterrupt during output reading
-                def read_with_interrupt():
-                    yield "Server started\n"
-                    raise KeyboardInterrupt()
-                
-                mock_process.stdout = read_with_interrupt()
+                read_with_interrupt = [b"Server started\n", KeyboardInterrupt()]
                 
-                import io
-                from contextlib import redirect_stdout
-                f = io.StringIO()
-                with redirect_stdout(f):
+                with patch('os.read', side_effect=read_with_interrupt):
                     console.run_asio_server()
                 
-                # Check that terminate was called
+                # Check that terminate was called and output was prefixed
                 mock_process.terminate.assert_called_once()
+                assert "[server] Server started\n" in capsys.readouterr().out
+
+    def test_pump_prefixed_output_carries_partial_lines(self):
+        """Lines split across reads are prefixed once"""
+        from run import pump_prefixed_output
+
+        chunks = [b"Listen", b"ing on 8080\nGET /health\nGET /res", b"ults", b""]
+        written = []
+        with patch('os.read', side_effect=chunks):
+            pump_prefixed_output(0, written.append)
+
+        assert b"".join(written) == (
+            b"[server] Listening on 8080\n"
+            b"[server] GET /health\n"
+            b"[server] GET /results\n"
+        )
 
 
 class TestRunAllTasks:
     """Tests for run_all_tasks() functionality (Task 5.1)"""
     
-    def test_run_all_tasks_without_module(self):
-        """TC-E2E-05: Error handling when module missing"""
-        console = BenchmarkConsole()
-        
-        with patch.object(console, 'check_cpp_module', return_value=False):
-            # Should return early without crashing when module is missing
-            # No exception should be raised
-            console.run_all_tasks()
-
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_all_tasks_calls_all_demos_and_benchmarks(self):
+    @requires_cpp
+    def test_run_all_tasks_calls_all_demos_and_benchmarks(self, console, capsys):
         """TC-E2E-01: Run all tasks completes successfully"""
-        console = BenchmarkConsole()
-        
-        if CPP_MODULE_AVAILABLE:
+        with ExitStack() as stack:
             # Mock all C++ functions
-            with patch.object(cpp, 'demonstrate_weak_ptr_lock') as mock_demo1:
-                with patch.object(cpp, 'benchmark_weak_ptr_lock', return_value=50000000) as mock_bench1:
-                    with patch.object(cpp, 'benchmark_naive_erase', return_value=100000000) as mock_bench2_1:
-                        with patch.object(cpp, 'benchmark_remove_if_erase', return_value=50000000) as mock_bench2_2:
-                            with patch.object(cpp, 'benchmark_iterators_erase', return_value=80000000) as mock_bench2_3:
-                                with patch.object(cpp, 'benchmark_copy_erase', return_value=30000000) as mock_bench2_4:
-                                    with patch.object(cpp, 'benchmark_partition_erase', return_value=25000000) as mock_bench2_5:
-                                        # Mock Task 3 results
-                                        mock_map_result = Mock()
-                                        mock_map_result.container_name = "std::map"
-                                        mock_map_result.insert_time_ns = 10000000
-                                        mock_map_result.lookup_time_ns = 5000000
-                                        mock_map_result.erase_time_ns = 8000000
-                                        mock_map_result.memory_usage_bytes = 1000000
-                                        
-                                        mock_umap_result = Mock()
-                                        mock_umap_result.container_name = "std::unordered_map"
-                                        mock_umap_result.insert_time_ns = 8000000
-                                        mock_umap_result.lookup_time_ns = 2000000
-                                        mock_umap_result.erase_time_ns = 6000000
-                                        mock_umap_result.memory_usage_bytes = 1200000
-                                        
-                                        mock_vec_result = Mock()
-                                        mock_vec_result.container_name = "std::vector<pair>"
-                                        mock_vec_result.insert_time_ns = 5000000
-                                        mock_vec_result.lookup_time_ns = 15000000
-                                        mock_vec_result.erase_time_ns = 10000000
-                                        mock_vec_result.memory_usage_bytes = 800000
-                                        
-                                        with patch.object(cpp, 'benchmark_map', return_value=mock_map_result):
-                                            with patch.object(cpp, 'benchmark_unordered_map', return_value=mock_umap_result):
-                                                with patch.object(cpp, 'benchmark_vector', return_value=mock_vec_result):
-                                                    with patch.object(console.db, 'is_connected', return_value=False):
-                                                        import io
-                                                        from contextlib import redirect_stdout
-                                                        f = io.StringIO()
-                                                        with redirect_stdout(f):
-                                                            console.run_all_tasks()
-                                                        output = f.getvalue()
-                                                        
-                                                        # Check that all tasks were called
-                                                        assert "Task 1" in output
-                                                        assert "Task 2" in output
-                                                        assert "Task 3" in output
-                                                        assert "Summary" in output or "summary" in output.lower()
-                                                        
-                                                        # Check that demo was called
-                                                        mock_demo1.assert_called_once()
-                                                        
-                                                        # Check that benchmarks were called
-                                                        mock_bench1.assert_called_once()
-                                                        mock_bench2_1.assert_called_once()
-                                                        mock_bench2_2.assert_called_once()
-                                                        mock_bench2_3.assert_called_once()
-                                                        mock_bench2_4.assert_called_once()
-                                                        mock_bench2_5.assert_called_once()
+            mocks = _patch_cpp(
+                stack,
+                demonstrate_weak_ptr_lock=None,
+                benchmark_weak_ptr_lock=50000000,
+                **TASK2_TIMES,
+                **TASK3_RESULTS,
+            )
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_all_tasks()
+            output = capsys.readouterr().out
+        
+        # Check that all tasks were called
+        assert "Task 1" in output
+        assert "Task 2" in output
+        assert "Task 3" in output
+        assert "Summary" in output or "summary" in output.lower()
+        
+        # Check that demo was called
+        mocks['demonstrate_weak_ptr_lock'].assert_called_once()
+        
+        # Check that benchmarks were called
+        mocks['benchmark_weak_ptr_lock'].assert_called_once()
+        for name in TASK2_TIMES:
+            mocks[name].assert_called_once()
     
-    @pytest.mark.skipif(not CPP_MODULE_AVAILABLE, reason="C++ module not available")
-    def test_run_all_tasks_shows_summary(self):
+    @requires_cpp
+    def test_run_all_tasks_shows_summary(self, console, capsys):
         """TC-E2E-01: Summary of results is displayed"""
-        console = BenchmarkConsole()
+        with ExitStack() as stack:
+            _patch_cpp(
+                stack,
+                demonstrate_weak_ptr_lock=None,
+                benchmark_weak_ptr_lock=50000000,
+                **TASK2_TIMES,
+                **TASK3_RESULTS,
+            )
+            stack.enter_context(patch.object(console.db, 'is_connected', return_value=False))
+            console.run_all_tasks()
+            output = capsys.readouterr().out
         
-        if CPP_MODULE_AVAILABLE:
-            with patch.object(cpp, 'demonstrate_weak_ptr_lock'):
-                with patch.object(cpp, 'benchmark_weak_ptr_lock', return_value=50000000):
-                    with patch.object(cpp, 'benchmark_naive_erase', return_value=100000000):
-                        with patch.object(cpp, 'benchmark_remove_if_erase', return_value=50000000):
-                            with patch.object(cpp, 'benchmark_iterators_erase', return_value=80000000):
-                                with patch.object(cpp, 'benchmark_copy_erase', return_value=30000000):
-                                    with patch.object(cpp, 'benchmark_partition_erase', return_value=25000000):
-                                        mock_map_result = Mock()
-                                        mock_map_result.container_name = "std::map"
-                                        mock_map_result.lookup_time_ns = 5000000
-                                        mock_map_result.insert_time_ns = 10000000
-                                        mock_map_result.erase_time_ns = 8000000
-                                        mock_map_result.memory_usage_bytes = 1000000
-                                        
-                                        mock_umap_result = Mock()
-                                        mock_umap_result.container_name = "std::unordered_map"
-                                        mock_umap_result.lookup_time_ns = 2000000
-                                        mock_umap_result.insert_time_ns = 8000000
-                                        mock_umap_result.erase_time_ns = 6000000
-                                        mock_umap_result.memory_usage_bytes = 1200000
-                                        
-                                        mock_vec_result = Mock()
-                                        mock_vec_result.container_name = "std::vector<pair>"
-                                        mock_vec_result.lookup_time_ns = 15000000
-                                        mock_vec_result.insert_time_ns = 5000000
-                                        mock_vec_result.erase_time_ns = 10000000
-                                        mock_vec_result.memory_usage_bytes = 800000
-                                        
-                                        with patch.object(cpp, 'benchmark_map', return_value=mock_map_result):
-                                            with patch.object(cpp, 'benchmark_unordered_map', return_value=mock_umap_result):
-                                                with patch.object(cpp, 'benchmark_vector', return_value=mock_vec_result):
-                                                    with patch.object(console.db, 'is_connected', return_value=False):
-                                                        import io
-                                                        from contextlib import redirect_stdout
-                                                        f = io.StringIO()
-                                                        with redirect_stdout(f):
-                                                            console.run_all_tasks()
-                                                        output = f.getvalue()
-                                                        
-                                                        # Check summary section
-                                                        assert "Summary" in output or "summary" in output.lower()
-                                                        # Check that all tasks are in summary
-                                                        assert "Task 1" in output
-                                                        assert "Task 2" in output
-                                                        assert "Task 3" in output
+        # Check summary section
+        assert "Summary" in output or "summary" in output.lower()
+        # Check that all tasks are in summary
+        assert "Task 1" in output
+        assert "Task 2" in output
+        assert "Task 3" in output
 
 
 if __name__ == "__main__":
@@ -13,14 +13,14 @@ Usage:
   python3 view_results.py --export csv       # Export to CSV
   python3 view_results.py --export json      # Export to JSON
   python3 view_results.py --limit 100        # Limit number of records
-  python3 view_results.py --watch            # Monitoring mode (update every 5 sec)
+  python3 view_results.py --watch            # Monitoring mode (update on new results)
 """
 
 import sys
 import os
 import argparse
 import json
-import csv
+import io
 import time
 from datetime import datetime
 from typing import Optional, List, Dict
@@ -28,10 +28,45 @@ from typing import Optional, List, Dict
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from db_manager import DatabaseManager
 
+# orjson serializes datetimes itself and is several times faster; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Result listing columns: date/time, build, task, method, time, ops/sec, threads
+RESULTS_ROW = "{:<20} {:<8} {:<22} {:<28} {:<15} {:<12} {:<8}"
+RESULTS_HEADER = (
+    "\n" + "=" * 135 + "\n"
+    + RESULTS_ROW.format('Date/Time', 'Build', 'Task', 'Method', 'Time', 'Ops/sec', 'Threads')
+    + "\n" + "=" * 135 + "\n"
+)
+
+# Per-task statistics columns: method, build, runs, average, min, max
+STATISTICS_ROW = "{:<30} {:<10} {:<8} {:<15} {:<15} {:<15}"
+STATISTICS_HEADER = (
+    "-" * 95 + "\n"
+    + STATISTICS_ROW.format('Method', 'Build', 'Runs', 'Average', 'Min', 'Max')
+    + "\n" + "-" * 95
+)
+
+# Release vs Debug columns: method, release time, debug time, speedup, release ops/s
+COMPARISON_ROW = "{:<35} {:<18} {:<18} {:<12} {:<15}"
+COMPARISON_HEADER = (
+    "-" * 110 + "\n"
+    + COMPARISON_ROW.format('Method', 'Release Time', 'Debug Time', 'Speedup', 'Release Ops/s')
+    + "\n" + "-" * 110
+)
+
+# ANSI erase display + cursor home; replaces spawning clear/cls every tick
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
 
 class ResultsViewer:
     def __init__(self):
-        self.db = DatabaseManager()
+        # Queries run one after another (watch mode listens on its own
+        # connection), so a single pooled connection is enough
+        self.db = DatabaseManager(min_size=1)
         if not self.db.is_connected():
             print("❌ Error: failed to connect to DB")
             print("Make sure PostgreSQL is running")
@@ -61,12 +96,7 @@ class ResultsViewer:
 
     def print_header(self):
         """Print table header"""
-        print()
-        print("=" * 135)
-        print(
-            f"{'Date/Time':<20} {'Build':<8} {'Task':<22} {'Method':<28} {'Time':<15} {'Ops/sec':<12} {'Threads':<8}"
-        )
-        print("=" * 135)
+        sys.stdout.write(RESULTS_HEADER)
 
     def print_results(self, results: List[Dict]):
         """Print results as table"""
@@ -74,31 +104,32 @@ class ResultsViewer:
             print("📭 No saved results")
             return
 
-        self.print_header()
-        
+        # Build the whole table and emit it in one write
+        lines = []
+        # get_results() rows carry every column (task and method names are
+        # NOT NULL), so only the nullable ones need a fallback
         for r in results:
-            timestamp = r['timestamp'].strftime('%Y-%m-%d %H:%M:%S') if r['timestamp'] else 'N/A'
-            build_type = r.get("build_type", "N/A")[:7]
-            task_name = r.get("task_name", f"Task {r.get('task_number', '?')}")[:21]
-            method_name = r.get("method_name", "Unknown")[:27]
-            time_str = self.format_time_ns(r.get('execution_time_ns', 0))
-            ops_str = self.format_ops(r.get('operations_per_second'))
-            threads = r.get('thread_count', 1)
-
-            print(
-                f"{timestamp:<20} {build_type:<8} {task_name:<22} {method_name:<28} {time_str:<15} {ops_str:<12} {threads:<8}"
-            )
-
-        print("-" * 135)
-        print(f"Total records: {len(results)}")
+            timestamp = r['timestamp']
+            lines.append(RESULTS_ROW.format(
+                timestamp.strftime('%Y-%m-%d %H:%M:%S') if timestamp else 'N/A',
+                (r['build_type'] or 'N/A')[:7],
+                r['task_name'][:21],
+                r['method_name'][:27],
+                self.format_time_ns(r['execution_time_ns']),
+                self.format_ops(r['operations_per_second']),
+                r['thread_count'] or 1,
+            ))
+
+        lines.append("-" * 135)
+        lines.append(f"Total records: {len(results)}")
+        sys.stdout.write(RESULTS_HEADER + "\n".join(lines) + "\n")
 
     def print_statistics(
         self, task_number: Optional[int] = None, build_type: Optional[str] = None
     ):
         """Print statistics by methods"""
         build_filter = f" ({build_type})" if build_type else ""
-        print(f"\n📊 STATISTICS BY METHODS{build_filter}")
-        print("=" * 110)
+        lines = [f"\n📊 STATISTICS BY METHODS{build_filter}", "=" * 110]
 
         tasks = [task_number] if task_number else [1, 2, 3]
 
@@ -107,29 +138,24 @@ class ResultsViewer:
             if not stats:
                 continue
 
-            print(f"\n📌 Task {task}")
-            print("-" * 95)
-            print(
-                f"{'Method':<30} {'Build':<10} {'Runs':<8} {'Average':<15} {'Min':<15} {'Max':<15}"
-            )
-            print("-" * 95)
+            lines.append(f"\n📌 Task {task}")
+            lines.append(STATISTICS_HEADER)
 
             for s in stats:
                 method = s.get("method_name", "Unknown")[:29]
-                build = s.get("build_type", "N/A")[:9]
+                build = (s.get("build_type") or "N/A")[:9]
                 count = s.get("count", 0)
                 avg = self.format_time_ns(int(s.get("avg_time_ns", 0)))
                 min_t = self.format_time_ns(int(s.get("min_time_ns", 0)))
                 max_t = self.format_time_ns(int(s.get("max_time_ns", 0)))
 
-                print(
-                    f"{method:<30} {build:<10} {count:<8} {avg:<15} {min_t:<15} {max_t:<15}"
-                )
+                lines.append(STATISTICS_ROW.format(method, build, count, avg, min_t, max_t))
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_comparison(self, task_number: Optional[int] = None):
         """Print Release vs Debug comparison"""
-        print("\n⚡ RELEASE vs DEBUG COMPARISON")
-        print("=" * 120)
+        lines = ["\n⚡ RELEASE vs DEBUG COMPARISON", "=" * 120]
 
         tasks = [task_number] if task_number else [1, 2, 3]
 
@@ -138,85 +164,52 @@ class ResultsViewer:
             if not comparison:
                 continue
 
-            # Group by method
-            methods = {}
+            lines.append(f"\n📌 Task {task}")
+            lines.append(COMPARISON_HEADER)
+
             for row in comparison:
                 method = row["method_name"]
-                build = row["build_type"]
-                if method not in methods:
-                    methods[method] = {}
-                methods[method][build] = row
-
-            print(f"\n📌 Task {task}")
-            print("-" * 110)
-            print(
-                f"{'Method':<35} {'Release Time':<18} {'Debug Time':<18} {'Speedup':<12} {'Release Ops/s':<15}"
-            )
-            print("-" * 110)
-
-            for method, builds in methods.items():
-                release = builds.get("Release", {})
-                debug = builds.get("Debug", {})
-
-                release_time = int(release.get("avg_time_ns", 0)) if release else 0
-                debug_time = int(debug.get("avg_time_ns", 0)) if debug else 0
-                release_ops = release.get("avg_ops_per_sec") if release else None
+                release_time = int(row["release_avg"]) if row["release_avg"] else 0
+                debug_time = int(row["debug_avg"]) if row["debug_avg"] else 0
 
                 release_str = (
                     self.format_time_ns(release_time) if release_time else "N/A"
                 )
                 debug_str = self.format_time_ns(debug_time) if debug_time else "N/A"
-                ops_str = self.format_ops(release_ops)
+                ops_str = self.format_ops(row["release_ops"])
 
-                # Calculate speedup
-                if release_time and debug_time:
-                    speedup = debug_time / release_time
+                if row["slowdown"] is not None:
+                    speedup = float(row["slowdown"])
                     speedup_str = f"{speedup:.2f}x"
                     if speedup > 1:
                         speedup_str = f"🚀 {speedup_str}"
                 else:
                     speedup_str = "N/A"
 
-                print(
-                    f"{method[:34]:<35} {release_str:<18} {debug_str:<18} {speedup_str:<12} {ops_str:<15}"
-                )
+                lines.append(COMPARISON_ROW.format(
+                    method[:34], release_str, debug_str, speedup_str, ops_str
+                ))
 
-    def export_csv(self, results: List[Dict], filename: str = "benchmark_results.csv"):
-        """Export to CSV"""
-        if not results:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def export_csv(
+        self,
+        filename: str = "benchmark_results.csv",
+        task_number: Optional[int] = None,
+        build_type: Optional[str] = None,
+        limit: int = 10000,
+    ):
+        """Export to CSV (formatted by PostgreSQL via COPY)"""
+        # Buffered so nothing is written when there are no rows
+        buf = io.BytesIO()
+        if not self.db.export_results_csv(
+            buf, task_number=task_number, limit=limit, build_type=build_type
+        ):
             print("❌ No data to export")
             return
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "timestamp",
-                    "build_type",
-                    "task_number",
-                    "task_name",
-                    "method_name",
-                    "execution_time_ns",
-                    "operations_per_second",
-                    "thread_count",
-                    "parameters",
-                ],
-            )
-            writer.writeheader()
-            
-            for r in results:
-                row = {
-                    "timestamp": r["timestamp"].isoformat() if r["timestamp"] else "",
-                    "build_type": r.get("build_type", "Release"),
-                    "task_number": r.get("task_number", ""),
-                    "task_name": r.get("task_name", ""),
-                    "method_name": r.get("method_name", ""),
-                    "execution_time_ns": r.get("execution_time_ns", ""),
-                    "operations_per_second": r.get("operations_per_second", ""),
-                    "thread_count": r.get("thread_count", 1),
-                    "parameters": json.dumps(r.get("parameters", {})),
-                }
-                writer.writerow(row)
+        with open(filename, 'wb') as f:
+            f.write(buf.getbuffer())
         
         print(f"✅ Results exported to {filename}")
 
@@ -226,34 +219,58 @@ class ResultsViewer:
             print("❌ No data to export")
             return
         
-        # Convert datetime to strings
-        export_data = []
-        for r in results:
-            row = dict(r)
-            if row.get('timestamp'):
-                row['timestamp'] = row['timestamp'].isoformat()
-            export_data.append(row)
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            # Convert datetime to strings
+            export_data = []
+            for r in results:
+                row = dict(r)
+                if row.get('timestamp'):
+                    row['timestamp'] = row['timestamp'].isoformat()
+                export_data.append(row)
+            
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
         
         print(f"✅ Results exported to {filename}")
 
-    def watch_mode(self, task_number: Optional[int] = None, interval: int = 5):
-        """Monitoring mode - update every N seconds"""
-        print(f"👁️ Monitoring mode (update every {interval} sec). Press Ctrl+C to exit.")
+    def watch_mode(
+        self,
+        task_number: Optional[int] = None,
+        interval: int = 5,
+        build_type: Optional[str] = None,
+    ):
+        """Monitoring mode - update when new results are saved, at most every N seconds"""
+        print(
+            f"👁️ Monitoring mode (update on new results, at most every {interval} sec). "
+            "Press Ctrl+C to exit."
+        )
+        
+        if os.name == 'nt':
+            # An empty command switches the Windows console to VT processing
+            os.system('')
         
         try:
-            while True:
-                # Clear screen
-                os.system('clear' if os.name == 'posix' else 'cls')
-                
-                print(f"⏰ Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                results = self.db.get_results(task_number=task_number, limit=20)
-                self.print_results(results)
-                
-                time.sleep(interval)
+            with self.db.listen() as wait:
+                while True:
+                    sys.stdout.write(
+                        CLEAR_SCREEN
+                        + f"⏰ Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    )
+                    
+                    results = self.db.get_results(
+                        task_number=task_number, limit=20, build_type=build_type
+                    )
+                    self.print_results(results)
+                    sys.stdout.flush()
+                    
+                    # Inserts made while sleeping stay queued on the listening
+                    # connection; an idle database is not queried at all
+                    time.sleep(interval)
+                    while not wait(interval):
+                        pass
         except KeyboardInterrupt:
             print("\n\n👋 Monitoring stopped")
 
@@ -302,9 +319,9 @@ Examples:
     parser.add_argument('--output', '-o', type=str,
                         help='Output filename for export')
     parser.add_argument('--watch', '-w', action='store_true',
-                        help='Monitoring mode (update every 5 sec)')
+                        help='Monitoring mode (update when new results are saved)')
     parser.add_argument('--interval', '-i', type=int, default=5,
-                        help='Update interval for --watch (default: 5 sec)')
+                        help='Minimum seconds between --watch updates (default: 5 sec)')
     
     args = parser.parse_args()
     
@@ -312,21 +329,32 @@ Examples:
     
     try:
         if args.watch:
-            viewer.watch_mode(task_number=args.task, interval=args.interval)
+            viewer.watch_mode(
+                task_number=args.task, interval=args.interval, build_type=args.build
+            )
         elif args.compare:
             viewer.print_comparison(task_number=args.task)
         elif args.stats:
             viewer.print_statistics(task_number=args.task, build_type=args.build)
         elif args.export:
-            results = viewer.db.get_results(task_number=args.task, limit=10000)
             filename = args.output or f"benchmark_results.{args.export}"
             if args.export == 'csv':
-                viewer.export_csv(results, filename)
+                viewer.export_csv(filename, task_number=args.task, build_type=args.build)
             else:
+                results = viewer.db.get_results(
+                    task_number=args.task, limit=10000, build_type=args.build
+                )
                 viewer.export_json(results, filename)
         else:
-            results = viewer.db.get_results(task_number=args.task, limit=args.limit)
+            results = viewer.db.get_results(
+                task_number=args.task, limit=args.limit, build_type=args.build
+            )
             viewer.print_results(results)
+    except BrokenPipeError:
+        # The reader (e.g. | head) went away; point stdout at devnull so the
+        # interpreter's final flush does not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
     finally:
         viewer.close()
 
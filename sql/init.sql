@@ -10,7 +10,10 @@ CREATE TABLE IF NOT EXISTS benchmark_results (
     operations_per_second DOUBLE PRECISION,
     thread_count INTEGER DEFAULT 1,
     build_type VARCHAR(20) DEFAULT 'Release',  -- Release or Debug
-    notes TEXT
+    notes TEXT,
+    -- Frequently used parameters kept out of the JSONB payload
+    vector_size INTEGER,
+    lookup_iterations INTEGER
 );
 
 -- Migration: Add build_type column if it doesn't exist (for existing databases)
@@ -24,12 +27,152 @@ BEGIN
     END IF;
 END $$;
 
+-- Migration: Move hot parameters into typed columns
+ALTER TABLE benchmark_results ADD COLUMN IF NOT EXISTS vector_size INTEGER;
+ALTER TABLE benchmark_results ADD COLUMN IF NOT EXISTS lookup_iterations INTEGER;
+
 -- Indexes for fast search
 CREATE INDEX IF NOT EXISTS idx_benchmark_results_task ON benchmark_results(task_number);
 CREATE INDEX IF NOT EXISTS idx_benchmark_results_timestamp ON benchmark_results(timestamp);
 CREATE INDEX IF NOT EXISTS idx_benchmark_results_method ON benchmark_results(method_name);
 CREATE INDEX IF NOT EXISTS idx_benchmark_results_build_type ON benchmark_results(build_type);
 
+-- Composite indexes: latest results per task (and per build type), and
+-- covering index for per-method/build-type aggregations (index-only scans)
+CREATE INDEX IF NOT EXISTS idx_results_task_time ON benchmark_results(task_number, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_results_task_build_time ON benchmark_results(task_number, build_type, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_results_task_method_build ON benchmark_results(task_number, method_name, build_type)
+    INCLUDE (execution_time_ns, operations_per_second);
+
+-- Running totals per task/method/build type for statistics and build
+-- comparisons. Statement-level triggers fold each INSERT or COPY batch in
+-- and recompute the groups touched by UPDATE or DELETE, so reads cost the
+-- number of methods instead of a scan of every result (a materialized
+-- view would be recomputed in full on refresh).
+CREATE TABLE IF NOT EXISTS benchmark_stats (
+    task_number INTEGER NOT NULL,
+    method_name VARCHAR(255) NOT NULL,
+    -- '' for results saved without a build type (primary keys cannot hold NULL)
+    build_type VARCHAR(20) NOT NULL,
+    run_count BIGINT NOT NULL,
+    total_time_ns NUMERIC NOT NULL,
+    min_time_ns BIGINT NOT NULL,
+    max_time_ns BIGINT NOT NULL,
+    -- operations_per_second is nullable; its average skips NULLs
+    ops_count BIGINT NOT NULL,
+    total_ops DOUBLE PRECISION,
+    PRIMARY KEY (task_number, method_name, build_type)
+);
+
+CREATE OR REPLACE FUNCTION benchmark_stats_add() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO benchmark_stats AS s
+    SELECT task_number, method_name, COALESCE(build_type, ''), COUNT(*), SUM(execution_time_ns),
+           MIN(execution_time_ns), MAX(execution_time_ns),
+           COUNT(operations_per_second), SUM(operations_per_second)
+    FROM new_rows
+    GROUP BY 1, 2, 3
+    ON CONFLICT (task_number, method_name, build_type) DO UPDATE SET
+        run_count = s.run_count + EXCLUDED.run_count,
+        total_time_ns = s.total_time_ns + EXCLUDED.total_time_ns,
+        min_time_ns = LEAST(s.min_time_ns, EXCLUDED.min_time_ns),
+        max_time_ns = GREATEST(s.max_time_ns, EXCLUDED.max_time_ns),
+        ops_count = s.ops_count + EXCLUDED.ops_count,
+        total_ops = COALESCE(s.total_ops + EXCLUDED.total_ops, s.total_ops, EXCLUDED.total_ops);
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+-- Removed rows can carry a group's minimum or maximum, so the groups
+-- they belonged to are aggregated again from benchmark_results
+CREATE OR REPLACE FUNCTION benchmark_stats_recompute(tasks INTEGER[], methods TEXT[], builds TEXT[])
+RETURNS void AS $$
+    DELETE FROM benchmark_stats s
+    USING unnest(tasks, methods, builds) AS k(task_number, method_name, build_type)
+    WHERE s.task_number = k.task_number AND s.method_name = k.method_name
+      AND s.build_type = k.build_type;
+
+    INSERT INTO benchmark_stats
+    SELECT r.task_number, r.method_name, COALESCE(r.build_type, ''), COUNT(*), SUM(r.execution_time_ns),
+           MIN(r.execution_time_ns), MAX(r.execution_time_ns),
+           COUNT(r.operations_per_second), SUM(r.operations_per_second)
+    FROM benchmark_results r
+    JOIN unnest(tasks, methods, builds) AS k(task_number, method_name, build_type)
+      ON r.task_number = k.task_number AND r.method_name = k.method_name
+     AND COALESCE(r.build_type, '') = k.build_type
+    GROUP BY 1, 2, 3;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION benchmark_stats_delete() RETURNS trigger AS $$
+BEGIN
+    PERFORM benchmark_stats_recompute(array_agg(task_number), array_agg(method_name), array_agg(build_type))
+    FROM (SELECT DISTINCT task_number, method_name, COALESCE(build_type, '') AS build_type
+          FROM old_rows) k;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION benchmark_stats_update() RETURNS trigger AS $$
+BEGIN
+    PERFORM benchmark_stats_recompute(array_agg(task_number), array_agg(method_name), array_agg(build_type))
+    FROM (SELECT task_number, method_name, COALESCE(build_type, '') AS build_type FROM old_rows
+          UNION
+          SELECT task_number, method_name, COALESCE(build_type, '') FROM new_rows) k;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION benchmark_stats_clear() RETURNS trigger AS $$
+BEGIN
+    TRUNCATE benchmark_stats;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+-- Recompute every group; run when this script is (re)applied, which also
+-- repairs totals left by older versions of the triggers
+CREATE OR REPLACE FUNCTION benchmark_stats_rebuild() RETURNS void AS $$
+    -- Block concurrent inserts so none are counted twice or missed
+    LOCK TABLE benchmark_results IN SHARE MODE;
+    DELETE FROM benchmark_stats;
+    INSERT INTO benchmark_stats
+    SELECT task_number, method_name, COALESCE(build_type, ''), COUNT(*), SUM(execution_time_ns),
+           MIN(execution_time_ns), MAX(execution_time_ns),
+           COUNT(operations_per_second), SUM(operations_per_second)
+    FROM benchmark_results
+    GROUP BY 1, 2, 3;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE TRIGGER benchmark_stats_insert
+    AFTER INSERT ON benchmark_results
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION benchmark_stats_add();
+
+CREATE OR REPLACE TRIGGER benchmark_stats_delete
+    AFTER DELETE ON benchmark_results
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION benchmark_stats_delete();
+
+CREATE OR REPLACE TRIGGER benchmark_stats_update
+    AFTER UPDATE ON benchmark_results
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION benchmark_stats_update();
+
+CREATE OR REPLACE TRIGGER benchmark_stats_truncate
+    AFTER TRUNCATE ON benchmark_results
+    FOR EACH STATEMENT EXECUTE FUNCTION benchmark_stats_clear();
+
+-- Migration: seed (or repair) the totals from the results already saved
+SELECT benchmark_stats_rebuild();
+
+-- Wake listeners (view_results.py --watch) once per INSERT or COPY
+-- statement; they re-query only when new results arrived
+CREATE OR REPLACE FUNCTION benchmark_results_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('benchmark_results_inserted', '');
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER benchmark_results_notify
+    AFTER INSERT ON benchmark_results
+    FOR EACH STATEMENT EXECUTE FUNCTION benchmark_results_notify();
+
 -- Table for run metadata
 CREATE TABLE IF NOT EXISTS benchmark_runs (
     id SERIAL PRIMARY KEY,
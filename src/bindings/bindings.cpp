@@ -4,18 +4,23 @@
 #include "../examples/weak_ptr/custom_weak_ptr.hpp"
 #include "../examples/vector_erase/vector_erase.hpp"
 #include "../examples/container_lookup/container_benchmark.hpp"
+#include "../core/perf_counters.hpp"
 
 namespace py= pybind11;
 
 PYBIND11_MODULE(benchmark_kit_bindings, m) {
 	m.doc()= "C++ Benchmark Kit - Python bindings for benchmarking C++ code";
 
+	// benchmark_* functions are pure C++ and release the GIL so Python
+	// callers can run several of them concurrently from threads
+
 	// Task 1: weak_ptr::lock()
 	m.def("demonstrate_weak_ptr_lock", &demonstrate_weak_ptr_lock,
 		"Demonstration of CustomWeakPtr::lock() operation");
 
 	m.def("benchmark_weak_ptr_lock", &benchmark_weak_ptr_lock,
 		"Benchmark for weak_ptr::lock()",
+		py::call_guard<py::gil_scoped_release>(),
 		py::arg("iterations"), py::arg("thread_count")= 1);
 
 	// Task 2: Removing every second element
@@ -36,19 +41,19 @@ PYBIND11_MODULE(benchmark_kit_bindings, m) {
 
 	// Task 2: Benchmark wrapper functions
 	m.def("benchmark_naive_erase", [](size_t vector_size, int iterations, int thread_count= 1) -> long long { return benchmark_vector_erase(erase_every_second_naive<int>, "naive",
-																												  vector_size, iterations, thread_count); }, "Benchmark for naive erase method", py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
+																												  vector_size, iterations, thread_count); }, "Benchmark for naive erase method", py::call_guard<py::gil_scoped_release>(), py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
 
 	m.def("benchmark_remove_if_erase", [](size_t vector_size, int iterations, int thread_count= 1) -> long long { return benchmark_vector_erase(erase_every_second_remove_if<int>, "remove_if",
-																													  vector_size, iterations, thread_count); }, "Benchmark for remove_if erase method", py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
+																													  vector_size, iterations, thread_count); }, "Benchmark for remove_if erase method", py::call_guard<py::gil_scoped_release>(), py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
 
 	m.def("benchmark_iterators_erase", [](size_t vector_size, int iterations, int thread_count= 1) -> long long { return benchmark_vector_erase(erase_every_second_iterators<int>, "iterators",
-																													  vector_size, iterations, thread_count); }, "Benchmark for iterators erase method", py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
+																													  vector_size, iterations, thread_count); }, "Benchmark for iterators erase method", py::call_guard<py::gil_scoped_release>(), py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
 
 	m.def("benchmark_copy_erase", [](size_t vector_size, int iterations, int thread_count= 1) -> long long { return benchmark_vector_erase(erase_every_second_copy<int>, "copy",
-																												 vector_size, iterations, thread_count); }, "Benchmark for copy erase method", py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
+																												 vector_size, iterations, thread_count); }, "Benchmark for copy erase method", py::call_guard<py::gil_scoped_release>(), py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
 
 	m.def("benchmark_partition_erase", [](size_t vector_size, int iterations, int thread_count= 1) -> long long { return benchmark_vector_erase(erase_every_second_partition<int>, "partition",
-																													  vector_size, iterations, thread_count); }, "Benchmark for partition erase method", py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
+																													  vector_size, iterations, thread_count); }, "Benchmark for partition erase method", py::call_guard<py::gil_scoped_release>(), py::arg("vector_size"), py::arg("iterations"), py::arg("thread_count")= 1);
 
 	// Task 3: Mapping number to string
 	// BenchmarkResult struct binding (must be before functions that return it)
@@ -71,14 +76,36 @@ PYBIND11_MODULE(benchmark_kit_bindings, m) {
 		py::arg("element_count"), py::arg("lookup_iterations"));
 
 	m.def("benchmark_map", &benchmark_map,
-		"Benchmark for std::map",
+		"Benchmark for std::map with arena-allocated nodes",
+		py::call_guard<py::gil_scoped_release>(),
 		py::arg("element_count"), py::arg("lookup_iterations"));
 
 	m.def("benchmark_unordered_map", &benchmark_unordered_map,
-		"Benchmark for std::unordered_map",
+		"Benchmark for std::unordered_map with arena-allocated nodes",
+		py::call_guard<py::gil_scoped_release>(),
 		py::arg("element_count"), py::arg("lookup_iterations"));
 
 	m.def("benchmark_vector", &benchmark_vector,
-		"Benchmark for std::vector",
+		"Benchmark for parallel key/value vectors scanned with SIMD",
+		py::call_guard<py::gil_scoped_release>(),
+		py::arg("element_count"), py::arg("lookup_iterations"));
+
+	m.def("benchmark_flat_hash", &benchmark_flat_hash,
+		"Benchmark for SwissTable-style flat hash map",
+		py::call_guard<py::gil_scoped_release>(),
 		py::arg("element_count"), py::arg("lookup_iterations"));
+
+	// Hardware counters (perf_event_open) for profiling benchmark calls
+	py::class_<benchmark_kit::PerfCounterValues>(m, "PerfCounterValues")
+		.def_readonly("cycles", &benchmark_kit::PerfCounterValues::cycles)
+		.def_readonly("instructions", &benchmark_kit::PerfCounterValues::instructions)
+		.def_readonly("cache_misses", &benchmark_kit::PerfCounterValues::cache_misses)
+		.def_readonly("branch_misses", &benchmark_kit::PerfCounterValues::branch_misses);
+
+	py::class_<benchmark_kit::PerfCounters>(m, "PerfCounters",
+		"Cycle, instruction, cache-miss and branch-miss counters for the calling thread")
+		.def(py::init<>())
+		.def_property_readonly("available", &benchmark_kit::PerfCounters::available)
+		.def("start", &benchmark_kit::PerfCounters::start)
+		.def("stop", &benchmark_kit::PerfCounters::stop);
 }
@@ -21,6 +21,7 @@
 #include "benchmark_runner.hpp"
 #include "timer.hpp"
 #include "statistics.hpp"
+#include "perf_counters.hpp"
 
 namespace benchmark_kit {
 
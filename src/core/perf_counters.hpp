@@ -0,0 +1,147 @@
+#pragma once
+
+#include <cstdint>
+
+#if defined(__linux__)
+#include <cstring>
+#include <linux/perf_event.h>
+#include <sys/ioctl.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+#endif
+
+/**
+ * C++ Benchmark Kit - Hardware Performance Counters
+ *
+ * Counts CPU cycles, retired instructions, cache misses and branch misses
+ * for the calling thread through Linux perf_event_open. Threads created by
+ * the measured code after start() are counted too (inherit), which is why
+ * each event is opened on its own rather than as a group: the kernel does
+ * not allow group reads on inherited events. When the PMU multiplexes
+ * events, values are scaled by time_enabled / time_running.
+ *
+ * available() is false when the kernel refuses the events
+ * (perf_event_paranoid, VMs without a virtual PMU, non-Linux builds);
+ * start() and stop() then do nothing and stop() returns zeros.
+ *
+ * Usage:
+ *   benchmark_kit::PerfCounters counters;
+ *   counters.start();
+ *   // ... code to measure ...
+ *   benchmark_kit::PerfCounterValues values = counters.stop();
+ */
+
+namespace benchmark_kit {
+
+struct PerfCounterValues {
+	uint64_t cycles = 0;
+	uint64_t instructions = 0;
+	uint64_t cache_misses = 0;
+	uint64_t branch_misses = 0;
+};
+
+class PerfCounters {
+public:
+	PerfCounters() {
+#if defined(__linux__)
+		static constexpr uint64_t kEvents[kEventCount] = {
+			PERF_COUNT_HW_CPU_CYCLES,
+			PERF_COUNT_HW_INSTRUCTIONS,
+			PERF_COUNT_HW_CACHE_MISSES,
+			PERF_COUNT_HW_BRANCH_MISSES,
+		};
+		for (int i = 0; i < kEventCount; ++i) {
+			perf_event_attr attr;
+			std::memset(&attr, 0, sizeof(attr));
+			attr.type = PERF_TYPE_HARDWARE;
+			attr.size = sizeof(attr);
+			attr.config = kEvents[i];
+			attr.disabled = 1;
+			attr.inherit = 1;
+			attr.exclude_kernel = 1;
+			attr.exclude_hv = 1;
+			attr.read_format = PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING;
+			fds_[i] = static_cast<int>(syscall(SYS_perf_event_open, &attr, 0, -1, -1, 0));
+			if (fds_[i] < 0) {
+				close_all();
+				return;
+			}
+		}
+#endif
+	}
+
+	~PerfCounters() {
+		close_all();
+	}
+
+	// Non-copyable
+	PerfCounters(const PerfCounters&) = delete;
+	PerfCounters& operator=(const PerfCounters&) = delete;
+
+	bool available() const {
+		return fds_[0] >= 0;
+	}
+
+	void start() {
+#if defined(__linux__)
+		if (!available()) {
+			return;
+		}
+		for (int fd : fds_) {
+			ioctl(fd, PERF_EVENT_IOC_RESET, 0);
+		}
+		for (int fd : fds_) {
+			ioctl(fd, PERF_EVENT_IOC_ENABLE, 0);
+		}
+#endif
+	}
+
+	PerfCounterValues stop() {
+		PerfCounterValues values;
+#if defined(__linux__)
+		if (!available()) {
+			return values;
+		}
+		for (int fd : fds_) {
+			ioctl(fd, PERF_EVENT_IOC_DISABLE, 0);
+		}
+		values.cycles = read_scaled(fds_[0]);
+		values.instructions = read_scaled(fds_[1]);
+		values.cache_misses = read_scaled(fds_[2]);
+		values.branch_misses = read_scaled(fds_[3]);
+#endif
+		return values;
+	}
+
+private:
+	static constexpr int kEventCount = 4;
+
+	int fds_[kEventCount] = {-1, -1, -1, -1};
+
+	void close_all() {
+#if defined(__linux__)
+		for (int& fd : fds_) {
+			if (fd >= 0) {
+				::close(fd);
+				fd = -1;
+			}
+		}
+#endif
+	}
+
+#if defined(__linux__)
+	static uint64_t read_scaled(int fd) {
+		// value, time_enabled, time_running
+		uint64_t data[3] = {0, 0, 0};
+		if (read(fd, data, sizeof(data)) != static_cast<ssize_t>(sizeof(data)) || data[2] == 0) {
+			return 0;
+		}
+		if (data[2] == data[1]) {
+			return data[0];
+		}
+		return static_cast<uint64_t>(static_cast<double>(data[0]) * data[1] / data[2]);
+	}
+#endif
+};
+
+} // namespace benchmark_kit
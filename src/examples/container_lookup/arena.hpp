@@ -0,0 +1,93 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <vector>
+
+/**
+ * Bump allocator owning a list of fixed-size chunks
+ *
+ * allocate() hands out consecutive, suitably aligned pieces of the current
+ * chunk and starts a new chunk when it runs out. Individual blocks are
+ * never freed; everything is released at once when the arena is destroyed.
+ * Node-based containers using it get one malloc per chunk instead of one
+ * per node, with nodes packed next to each other in insertion order.
+ */
+class Arena {
+public:
+	static constexpr size_t kDefaultChunkSize= 64 * 1024;
+
+	explicit Arena(size_t chunk_size= kDefaultChunkSize) :
+		chunk_size_(chunk_size) {
+	}
+
+	Arena(const Arena&)= delete;
+	Arena& operator=(const Arena&)= delete;
+
+	void* allocate(size_t bytes, size_t alignment) {
+		uintptr_t current= reinterpret_cast<uintptr_t>(cursor_);
+		size_t padding= (alignment - current % alignment) % alignment;
+		if(cursor_ == nullptr || padding + bytes > remaining_) {
+			size_t size= bytes + alignment > chunk_size_ ? bytes + alignment : chunk_size_;
+			chunks_.push_back(std::make_unique<char[]>(size));
+			cursor_= chunks_.back().get();
+			remaining_= size;
+			current= reinterpret_cast<uintptr_t>(cursor_);
+			padding= (alignment - current % alignment) % alignment;
+		}
+		char* block= cursor_ + padding;
+		cursor_= block + bytes;
+		remaining_-= padding + bytes;
+		return block;
+	}
+
+	size_t chunk_count() const {
+		return chunks_.size();
+	}
+
+private:
+	std::vector<std::unique_ptr<char[]>> chunks_;
+	char* cursor_= nullptr;
+	size_t remaining_= 0;
+	size_t chunk_size_;
+};
+
+// Standard allocator adaptor drawing from an Arena; deallocate() is a no-op
+template<typename T>
+class ArenaAllocator {
+public:
+	using value_type= T;
+
+	explicit ArenaAllocator(Arena& arena) noexcept :
+		arena_(&arena) {
+	}
+
+	template<typename U>
+	ArenaAllocator(const ArenaAllocator<U>& other) noexcept :
+		arena_(other.arena_) {
+	}
+
+	T* allocate(size_t n) {
+		return static_cast<T*>(arena_->allocate(n * sizeof(T), alignof(T)));
+	}
+
+	void deallocate(T* /*ptr*/, size_t /*n*/) noexcept {
+	}
+
+	template<typename U>
+	bool operator==(const ArenaAllocator<U>& other) const noexcept {
+		return arena_ == other.arena_;
+	}
+
+	template<typename U>
+	bool operator!=(const ArenaAllocator<U>& other) const noexcept {
+		return arena_ != other.arena_;
+	}
+
+private:
+	template<typename U>
+	friend class ArenaAllocator;
+
+	Arena* arena_;
+};
@@ -8,7 +8,9 @@
  * Options:
  * 1. std::map<int, std::string> - O(log n) lookup, ordered
  * 2. std::unordered_map<int, std::string> - O(1) average lookup, O(n) worst case
- * 3. std::vector<std::pair<int, std::string>> - for small sets, O(n) lookup
+ * 3. std::vector<std::pair<int, std::string>> - compact, O(n) lookup
+ *    (benchmarked as parallel key/value vectors so the scan is SIMD-friendly)
+ * 4. FlatHashMap - open addressing, O(1) average lookup scanning 16 control bytes per SIMD compare
  */
 
 struct BenchmarkResult {
@@ -25,8 +27,11 @@ BenchmarkResult benchmark_map(int element_count, int lookup_iterations);
 // Benchmark for std::unordered_map
 BenchmarkResult benchmark_unordered_map(int element_count, int lookup_iterations);
 
-// Benchmark for std::vector (linear search)
+// Benchmark for std::vector (linear SIMD search over a contiguous key array)
 BenchmarkResult benchmark_vector(int element_count, int lookup_iterations);
 
+// Benchmark for FlatHashMap (SwissTable-style open addressing)
+BenchmarkResult benchmark_flat_hash(int element_count, int lookup_iterations);
+
 // Comparative analysis of all containers
 void compare_containers(int element_count, int lookup_iterations);
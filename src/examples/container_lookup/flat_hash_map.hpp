@@ -0,0 +1,242 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <utility>
+#include <vector>
+
+#if defined(__SSE2__)
+#include <emmintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+/**
+ * Open-addressing int -> std::string hash table with a SwissTable-style layout
+ *
+ * Control bytes and slots are stored in separate arrays (SoA):
+ * - ctrl_[i] holds the low 7 bits of the key hash for a full slot, or kEmpty / kDeleted
+ * - slots_[i] holds the key/value pair
+ *
+ * Lookups scan control bytes a group of 16 at a time: one SIMD compare
+ * (SSE2 _mm_cmpeq_epi8 + _mm_movemask_epi8, or NEON vceqq_u8 + vshrn)
+ * yields a bitmask of candidate slots, so keys are only compared on a
+ * 7-bit hash match. Groups are probed with triangular steps, which visit
+ * every group when the group count is a power of two. The table grows
+ * at a load factor of 7/8; erase leaves tombstones.
+ */
+class FlatHashMap {
+public:
+	static constexpr size_t kGroupWidth= 16;
+
+	FlatHashMap() {
+		init(kGroupWidth);
+	}
+
+	explicit FlatHashMap(size_t expected_size) {
+		init(capacity_for(expected_size));
+	}
+
+	size_t size() const {
+		return size_;
+	}
+
+	size_t capacity() const {
+		return ctrl_.size();
+	}
+
+	// Approximate heap footprint: control bytes plus slot array
+	size_t memory_usage_bytes() const {
+		return ctrl_.size() * (sizeof(uint8_t) + sizeof(Slot));
+	}
+
+	// Insert or overwrite the value for key
+	void insert_or_assign(int key, std::string value) {
+		uint64_t hash= hash_key(key);
+		size_t index= find_index(key, hash);
+		if(index != kNotFound) {
+			slots_[index].second= std::move(value);
+			return;
+		}
+		if((size_ + deleted_ + 1) * 8 > capacity() * 7) {
+			rehash(size_ + 1 > capacity() / 2 ? capacity() * 2 : capacity());
+		}
+		index= find_insert_index(hash);
+		if(ctrl_[index] == kDeleted) {
+			--deleted_;
+		}
+		ctrl_[index]= h2(hash);
+		slots_[index]= {key, std::move(value)};
+		++size_;
+	}
+
+	// Pointer to the value for key, nullptr when absent
+	const std::string* find(int key) const {
+		size_t index= find_index(key, hash_key(key));
+		return index == kNotFound ? nullptr : &slots_[index].second;
+	}
+
+	// Start loading the first probe group for key so a later find() hits cache
+	void prefetch(int key) const {
+		const size_t base= (h1(hash_key(key)) & (capacity() / kGroupWidth - 1)) * kGroupWidth;
+		__builtin_prefetch(&ctrl_[base], 0, 1);
+		__builtin_prefetch(&slots_[base], 0, 1);
+	}
+
+	bool contains(int key) const {
+		return find(key) != nullptr;
+	}
+
+	// Returns true when key was present
+	bool erase(int key) {
+		size_t index= find_index(key, hash_key(key));
+		if(index == kNotFound) {
+			return false;
+		}
+		ctrl_[index]= kDeleted;
+		slots_[index].second= std::string();
+		--size_;
+		++deleted_;
+		return true;
+	}
+
+private:
+	using Slot= std::pair<int, std::string>;
+
+	static constexpr uint8_t kEmpty= 0x80;
+	static constexpr uint8_t kDeleted= 0xFE;
+	static constexpr size_t kNotFound= static_cast<size_t>(-1);
+
+#if defined(__ARM_NEON) && !defined(__SSE2__)
+	// vshrn packs each lane compare into a nibble; keep one bit per lane
+	static constexpr int kLaneShift= 2;
+	static constexpr uint64_t kLaneBits= 0x8888888888888888ULL;
+#else
+	static constexpr int kLaneShift= 0;
+#endif
+
+	std::vector<uint8_t> ctrl_;
+	std::vector<Slot> slots_;
+	size_t size_= 0;
+	size_t deleted_= 0;
+
+	// Smallest power-of-two multiple of the group width keeping size under 7/8 load
+	static size_t capacity_for(size_t expected_size) {
+		size_t capacity= kGroupWidth;
+		while(expected_size * 8 > capacity * 7) {
+			capacity*= 2;
+		}
+		return capacity;
+	}
+
+	// Fibonacci hashing mixes the identity std::hash<int> so both halves carry entropy
+	static uint64_t hash_key(int key) {
+		uint64_t hash= static_cast<uint64_t>(static_cast<uint32_t>(key)) * 0x9E3779B97F4A7C15ULL;
+		return hash ^ (hash >> 32);
+	}
+
+	static size_t h1(uint64_t hash) {
+		return static_cast<size_t>(hash >> 7);
+	}
+
+	static uint8_t h2(uint64_t hash) {
+		return static_cast<uint8_t>(hash & 0x7F);
+	}
+
+	static int lowest_lane(uint64_t mask) {
+		return __builtin_ctzll(mask) >> kLaneShift;
+	}
+
+	// Bitmask of lanes in the group at ctrl whose control byte equals value
+	static uint64_t match_byte(const uint8_t* ctrl, uint8_t value) {
+#if defined(__SSE2__)
+		__m128i group= _mm_loadu_si128(reinterpret_cast<const __m128i*>(ctrl));
+		__m128i match= _mm_cmpeq_epi8(group, _mm_set1_epi8(static_cast<char>(value)));
+		return static_cast<uint32_t>(_mm_movemask_epi8(match));
+#elif defined(__ARM_NEON)
+		uint8x16_t match= vceqq_u8(vld1q_u8(ctrl), vdupq_n_u8(value));
+		uint8x8_t packed= vshrn_n_u16(vreinterpretq_u16_u8(match), 4);
+		return vget_lane_u64(vreinterpret_u64_u8(packed), 0) & kLaneBits;
+#else
+		uint64_t mask= 0;
+		for(size_t i= 0; i < kGroupWidth; ++i) {
+			mask|= static_cast<uint64_t>(ctrl[i] == value) << i;
+		}
+		return mask;
+#endif
+	}
+
+	// Bitmask of empty or deleted lanes: both have the high bit set, full slots do not
+	static uint64_t match_empty_or_deleted(const uint8_t* ctrl) {
+#if defined(__SSE2__)
+		__m128i group= _mm_loadu_si128(reinterpret_cast<const __m128i*>(ctrl));
+		return static_cast<uint32_t>(_mm_movemask_epi8(group));
+#elif defined(__ARM_NEON)
+		uint8x16_t special= vcltq_s8(vreinterpretq_s8_u8(vld1q_u8(ctrl)), vdupq_n_s8(0));
+		uint8x8_t packed= vshrn_n_u16(vreinterpretq_u16_u8(special), 4);
+		return vget_lane_u64(vreinterpret_u64_u8(packed), 0) & kLaneBits;
+#else
+		uint64_t mask= 0;
+		for(size_t i= 0; i < kGroupWidth; ++i) {
+			mask|= static_cast<uint64_t>(ctrl[i] >> 7) << i;
+		}
+		return mask;
+#endif
+	}
+
+	void init(size_t capacity) {
+		ctrl_.assign(capacity, kEmpty);
+		slots_.assign(capacity, Slot());
+		size_= 0;
+		deleted_= 0;
+	}
+
+	size_t find_index(int key, uint64_t hash) const {
+		const size_t group_mask= capacity() / kGroupWidth - 1;
+		const uint8_t tag= h2(hash);
+		size_t group= h1(hash) & group_mask;
+		for(size_t step= 1;; ++step) {
+			const size_t base= group * kGroupWidth;
+			for(uint64_t mask= match_byte(&ctrl_[base], tag); mask != 0; mask&= mask - 1) {
+				size_t index= base + lowest_lane(mask);
+				if(slots_[index].first == key) {
+					return index;
+				}
+			}
+			// An empty slot ends the probe sequence: the key was never inserted past it
+			if(match_byte(&ctrl_[base], kEmpty) != 0) {
+				return kNotFound;
+			}
+			group= (group + step) & group_mask;
+		}
+	}
+
+	size_t find_insert_index(uint64_t hash) const {
+		const size_t group_mask= capacity() / kGroupWidth - 1;
+		size_t group= h1(hash) & group_mask;
+		for(size_t step= 1;; ++step) {
+			const size_t base= group * kGroupWidth;
+			uint64_t mask= match_empty_or_deleted(&ctrl_[base]);
+			if(mask != 0) {
+				return base + lowest_lane(mask);
+			}
+			group= (group + step) & group_mask;
+		}
+	}
+
+	void rehash(size_t new_capacity) {
+		std::vector<uint8_t> old_ctrl= std::move(ctrl_);
+		std::vector<Slot> old_slots= std::move(slots_);
+		init(new_capacity);
+		for(size_t i= 0; i < old_ctrl.size(); ++i) {
+			if((old_ctrl[i] & kEmpty) == 0) {
+				uint64_t hash= hash_key(old_slots[i].first);
+				size_t index= find_insert_index(hash);
+				ctrl_[index]= h2(hash);
+				slots_[index]= std::move(old_slots[i]);
+				++size_;
+			}
+		}
+	}
+};
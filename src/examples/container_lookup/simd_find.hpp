@@ -0,0 +1,57 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+
+#if defined(__AVX2__) || defined(__SSE2__)
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+/**
+ * Index of the first element equal to key in keys[0, count), or -1
+ *
+ * Compares a whole register of keys per step instead of branching on
+ * every element: 8 ints per _mm256_cmpeq_epi32 on AVX2, 4 per
+ * _mm_cmpeq_epi32 on SSE2 or vceqq_s32 on NEON. movemask (or vmaxvq on
+ * NEON) reduces the compare to one branch per register, and ctz picks
+ * the matching lane. A scalar loop handles the tail.
+ */
+inline std::ptrdiff_t simd_find_i32(const int32_t* keys, size_t count, int32_t key) {
+	size_t i= 0;
+#if defined(__AVX2__)
+	const __m256i needle= _mm256_set1_epi32(key);
+	for(; i + 8 <= count; i+= 8) {
+		__m256i block= _mm256_loadu_si256(reinterpret_cast<const __m256i*>(keys + i));
+		int mask= _mm256_movemask_epi8(_mm256_cmpeq_epi32(block, needle));
+		if(mask != 0) {
+			// movemask_epi8 yields 4 bits per 32-bit lane
+			return static_cast<std::ptrdiff_t>(i + (__builtin_ctz(static_cast<unsigned>(mask)) >> 2));
+		}
+	}
+#elif defined(__SSE2__)
+	const __m128i needle= _mm_set1_epi32(key);
+	for(; i + 4 <= count; i+= 4) {
+		__m128i block= _mm_loadu_si128(reinterpret_cast<const __m128i*>(keys + i));
+		int mask= _mm_movemask_epi8(_mm_cmpeq_epi32(block, needle));
+		if(mask != 0) {
+			return static_cast<std::ptrdiff_t>(i + (__builtin_ctz(static_cast<unsigned>(mask)) >> 2));
+		}
+	}
+#elif defined(__ARM_NEON) && defined(__aarch64__)
+	const int32x4_t needle= vdupq_n_s32(key);
+	for(; i + 4 <= count; i+= 4) {
+		uint32x4_t match= vceqq_s32(vld1q_s32(keys + i), needle);
+		if(vmaxvq_u32(match) != 0) {
+			break; // the scalar loop below finds the lane
+		}
+	}
+#endif
+	for(; i < count; ++i) {
+		if(keys[i] == key) {
+			return static_cast<std::ptrdiff_t>(i);
+		}
+	}
+	return -1;
+}
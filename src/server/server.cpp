@@ -333,6 +333,7 @@ private:
 				BenchmarkResult map_result= benchmark_map(static_cast<int>(size), static_cast<int>(lookups));
 				BenchmarkResult umap_result= benchmark_unordered_map(static_cast<int>(size), static_cast<int>(lookups));
 				BenchmarkResult vec_result= benchmark_vector(static_cast<int>(size), static_cast<int>(lookups));
+				BenchmarkResult flat_result= benchmark_flat_hash(static_cast<int>(size), static_cast<int>(lookups));
 
 				// Save each container result to database
 				std::string build_type= get_build_type();
@@ -347,13 +348,14 @@ private:
 				save_container_result(map_result);
 				save_container_result(umap_result);
 				save_container_result(vec_result);
+				save_container_result(flat_result);
 
 				// Helper to get complexity string
-				auto get_complexity= [](const std::string& name) -> std::string {
-					if(name == "std::map") {
+				auto get_complexity= [&](const std::string& name) -> std::string {
+					if(name == map_result.container_name) {
 						return "O(log n)";
 					}
-					if(name == "std::unordered_map") {
+					if(name == umap_result.container_name || name == flat_result.container_name) {
 						return "O(1) average";
 					}
 					return "O(n)";
@@ -363,15 +365,20 @@ private:
 				std::string recommendation;
 				if(umap_result.lookup_time_ns <= map_result.lookup_time_ns &&
 					umap_result.lookup_time_ns <= vec_result.lookup_time_ns) {
-					recommendation= "std::unordered_map for best lookup performance";
+					recommendation= umap_result.container_name + " for best lookup performance";
 				} else if(map_result.lookup_time_ns <= umap_result.lookup_time_ns &&
 					map_result.lookup_time_ns <= vec_result.lookup_time_ns) {
-					recommendation= "std::map for this dataset size";
+					recommendation= map_result.container_name + " for this dataset size";
 				} else {
-					recommendation= "std::vector<pair> for this dataset size";
+					recommendation= vec_result.container_name + " for this dataset size";
+				}
+				if(flat_result.lookup_time_ns < umap_result.lookup_time_ns &&
+					flat_result.lookup_time_ns < map_result.lookup_time_ns &&
+					flat_result.lookup_time_ns < vec_result.lookup_time_ns) {
+					recommendation= flat_result.container_name + " for best lookup performance";
 				}
 
-				std::vector<BenchmarkResult> results= {map_result, umap_result, vec_result};
+				std::vector<BenchmarkResult> results= {map_result, umap_result, vec_result, flat_result};
 
 				std::stringstream json;
 				json << "{\n";
@@ -1,6 +1,14 @@
 #define BOOST_TEST_MODULE Task3Tests
 #include <boost/test/unit_test.hpp>
+#include "examples/container_lookup/arena.hpp"
 #include "examples/container_lookup/container_benchmark.hpp"
+#include "examples/container_lookup/flat_hash_map.hpp"
+#include "examples/container_lookup/simd_find.hpp"
+
+#include <map>
+#include <random>
+#include <unordered_map>
+#include <vector>
 
 BOOST_AUTO_TEST_SUITE(Task3TestSuite)
 
@@ -8,7 +16,7 @@ BOOST_AUTO_TEST_CASE(test_benchmark_map_returns_valid_result) {
 	BenchmarkResult result= benchmark_map(1000, 1000);
 
 	BOOST_CHECK(!result.container_name.empty());
-	BOOST_CHECK_EQUAL(result.container_name, "std::map");
+	BOOST_CHECK_EQUAL(result.container_name, "std::map (arena)");
 	BOOST_CHECK_GT(result.insert_time_ns, 0);
 	BOOST_CHECK_GT(result.lookup_time_ns, 0);
 	BOOST_CHECK_GT(result.erase_time_ns, 0);
@@ -19,7 +27,7 @@ BOOST_AUTO_TEST_CASE(test_benchmark_unordered_map_returns_valid_result) {
 	BenchmarkResult result= benchmark_unordered_map(1000, 1000);
 
 	BOOST_CHECK(!result.container_name.empty());
-	BOOST_CHECK_EQUAL(result.container_name, "std::unordered_map");
+	BOOST_CHECK_EQUAL(result.container_name, "std::unordered_map (arena)");
 	BOOST_CHECK_GT(result.insert_time_ns, 0);
 	BOOST_CHECK_GT(result.lookup_time_ns, 0);
 	BOOST_CHECK_GT(result.erase_time_ns, 0);
@@ -30,13 +38,144 @@ BOOST_AUTO_TEST_CASE(test_benchmark_vector_returns_valid_result) {
 	BenchmarkResult result= benchmark_vector(1000, 1000);
 
 	BOOST_CHECK(!result.container_name.empty());
-	BOOST_CHECK_EQUAL(result.container_name, "std::vector<pair>");
+	BOOST_CHECK_EQUAL(result.container_name, "vector SoA+SIMD");
+	BOOST_CHECK_GT(result.insert_time_ns, 0);
+	BOOST_CHECK_GT(result.lookup_time_ns, 0);
+	BOOST_CHECK_GT(result.erase_time_ns, 0);
+	BOOST_CHECK_GT(result.memory_usage_bytes, 0);
+}
+
+BOOST_AUTO_TEST_CASE(test_benchmark_flat_hash_returns_valid_result) {
+	BenchmarkResult result= benchmark_flat_hash(1000, 1000);
+
+	BOOST_CHECK_EQUAL(result.container_name, "flat_hash_map");
 	BOOST_CHECK_GT(result.insert_time_ns, 0);
 	BOOST_CHECK_GT(result.lookup_time_ns, 0);
 	BOOST_CHECK_GT(result.erase_time_ns, 0);
 	BOOST_CHECK_GT(result.memory_usage_bytes, 0);
 }
 
+BOOST_AUTO_TEST_CASE(test_flat_hash_map_insert_find_erase) {
+	FlatHashMap container;
+	constexpr int kCount= 5000;
+
+	for(int i= 0; i < kCount; ++i) {
+		container.insert_or_assign(i, "value_" + std::to_string(i));
+	}
+	BOOST_CHECK_EQUAL(container.size(), static_cast<size_t>(kCount));
+	// Growth keeps the load factor at or below 7/8
+	BOOST_CHECK_LE(container.size() * 8, container.capacity() * 7);
+
+	for(int i= 0; i < kCount; ++i) {
+		const std::string* value= container.find(i);
+		BOOST_REQUIRE(value != nullptr);
+		BOOST_CHECK_EQUAL(*value, "value_" + std::to_string(i));
+	}
+	BOOST_CHECK(!container.contains(kCount));
+	BOOST_CHECK(!container.contains(-1));
+
+	container.insert_or_assign(7, "seven");
+	BOOST_CHECK_EQUAL(*container.find(7), "seven");
+	BOOST_CHECK_EQUAL(container.size(), static_cast<size_t>(kCount));
+
+	for(int i= 0; i < kCount; i+= 2) {
+		BOOST_CHECK(container.erase(i));
+	}
+	BOOST_CHECK(!container.erase(0));
+	BOOST_CHECK_EQUAL(container.size(), static_cast<size_t>(kCount / 2));
+	for(int i= 0; i < kCount; ++i) {
+		BOOST_CHECK_EQUAL(container.contains(i), i % 2 == 1);
+	}
+}
+
+BOOST_AUTO_TEST_CASE(test_flat_hash_map_matches_unordered_map) {
+	// Random insert/erase churn leaves tombstones and forces rehashes
+	FlatHashMap container;
+	std::unordered_map<int, std::string> reference;
+	std::mt19937 gen(42);
+	std::uniform_int_distribution<int> key_dis(-2000, 2000);
+
+	for(int i= 0; i < 50000; ++i) {
+		int key= key_dis(gen);
+		if(gen() % 3 == 0) {
+			BOOST_CHECK_EQUAL(container.erase(key), reference.erase(key) == 1);
+		} else {
+			std::string value= std::to_string(i);
+			container.insert_or_assign(key, value);
+			reference[key]= value;
+		}
+	}
+
+	BOOST_CHECK_EQUAL(container.size(), reference.size());
+	for(int key= -2000; key <= 2000; ++key) {
+		auto it= reference.find(key);
+		const std::string* value= container.find(key);
+		BOOST_REQUIRE_EQUAL(value != nullptr, it != reference.end());
+		if(value != nullptr) {
+			BOOST_CHECK_EQUAL(*value, it->second);
+		}
+	}
+}
+
+BOOST_AUTO_TEST_CASE(test_arena_allocations_are_aligned_and_disjoint) {
+	constexpr size_t kBlockSize= 40;
+	Arena arena(256);
+	std::vector<char*> blocks;
+	for(size_t alignment : {1, 2, 8, 16, 64, 8, 1}) {
+		char* block= static_cast<char*>(arena.allocate(kBlockSize, alignment));
+		BOOST_CHECK_EQUAL(reinterpret_cast<uintptr_t>(block) % alignment, 0u);
+		blocks.push_back(block);
+	}
+	for(size_t i= 0; i < blocks.size(); ++i) {
+		for(size_t j= i + 1; j < blocks.size(); ++j) {
+			BOOST_CHECK(blocks[i] + kBlockSize <= blocks[j] || blocks[j] + kBlockSize <= blocks[i]);
+		}
+	}
+
+	// Requests larger than a chunk get a dedicated chunk
+	size_t chunks= arena.chunk_count();
+	BOOST_CHECK(arena.allocate(1024, 8) != nullptr);
+	BOOST_CHECK_EQUAL(arena.chunk_count(), chunks + 1);
+}
+
+BOOST_AUTO_TEST_CASE(test_arena_allocator_backs_std_map) {
+	Arena arena;
+	std::map<int, std::string, std::less<int>, ArenaAllocator<std::pair<const int, std::string>>> container{
+		ArenaAllocator<std::pair<const int, std::string>>(arena)};
+
+	for(int i= 0; i < 1000; ++i) {
+		container[i]= "value_" + std::to_string(i);
+	}
+	for(int i= 0; i < 1000; i+= 10) {
+		container.erase(i);
+	}
+
+	BOOST_CHECK_EQUAL(container.size(), 900u);
+	BOOST_CHECK_EQUAL(container.at(11), "value_11");
+	BOOST_CHECK(container.find(10) == container.end());
+	BOOST_CHECK_GT(arena.chunk_count(), 0u);
+}
+
+BOOST_AUTO_TEST_CASE(test_simd_find_i32_matches_linear_search) {
+	// Sizes around register widths exercise both the SIMD body and the scalar tail
+	for(size_t count : {0, 1, 3, 4, 7, 8, 9, 17, 100}) {
+		std::vector<int32_t> keys(count);
+		for(size_t i= 0; i < count; ++i) {
+			keys[i]= static_cast<int32_t>(i * 3);
+		}
+		for(size_t i= 0; i < count; ++i) {
+			BOOST_CHECK_EQUAL(simd_find_i32(keys.data(), count, keys[i]), static_cast<std::ptrdiff_t>(i));
+		}
+		BOOST_CHECK_EQUAL(simd_find_i32(keys.data(), count, 1), -1);
+		BOOST_CHECK_EQUAL(simd_find_i32(keys.data(), count, -3), -1);
+	}
+
+	// First match wins when keys repeat
+	std::vector<int32_t> repeated= {5, 1, 1, 2, 1, 9, 9, 9, 9, 1};
+	BOOST_CHECK_EQUAL(simd_find_i32(repeated.data(), repeated.size(), 1), 1);
+	BOOST_CHECK_EQUAL(simd_find_i32(repeated.data(), repeated.size(), 9), 5);
+}
+
 BOOST_AUTO_TEST_CASE(test_container_name_is_set) {
 	BenchmarkResult map_result= benchmark_map(100, 100);
 	BenchmarkResult unordered_map_result= benchmark_unordered_map(100, 100);
@@ -46,9 +185,9 @@ BOOST_AUTO_TEST_CASE(test_container_name_is_set) {
 	BOOST_CHECK(!unordered_map_result.container_name.empty());
 	BOOST_CHECK(!vector_result.container_name.empty());
 
-	BOOST_CHECK_EQUAL(map_result.container_name, "std::map");
-	BOOST_CHECK_EQUAL(unordered_map_result.container_name, "std::unordered_map");
-	BOOST_CHECK_EQUAL(vector_result.container_name, "std::vector<pair>");
+	BOOST_CHECK_EQUAL(map_result.container_name, "std::map (arena)");
+	BOOST_CHECK_EQUAL(unordered_map_result.container_name, "std::unordered_map (arena)");
+	BOOST_CHECK_EQUAL(vector_result.container_name, "vector SoA+SIMD");
 }
 
 BOOST_AUTO_TEST_CASE(test_memory_usage_is_positive) {